@@ -3,7 +3,7 @@ from .core.registry import TaskRegistry
 from .core.task import Task, StreamingTask
 from .models.task_result import TaskResult, StreamingTaskResult, StreamingYielder
 from .models.task_group import TaskGroupConfig, TaskGroup, StreamingTaskGroup
-from .utils.logging import setup_task_logging, TaskLogFormatter
+from .utils.logging import setup_task_logging, TaskLogFormatter, TaskTimestampFilter, TaskLoggerAdapter
 from .utils.workflow_checker import WorkflowChecker
 from .cache import CacheInterface, MemoryCache, FileCache, RedisCache, CacheKeyGenerator 
 
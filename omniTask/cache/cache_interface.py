@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Optional, Dict
 from datetime import datetime, timedelta
@@ -23,7 +24,14 @@ class CacheEntry:
         return not self.is_expired() and self.result.success
 
 class CacheInterface(ABC):
-    """Abstract interface for task result caching."""
+    """Abstract interface for task result caching.
+    
+    Subclasses that define __init__ must call super().__init__().
+    """
+    
+    def __init__(self):
+        # Keys claimed by get_and_lock() whose producer has not released them yet
+        self._inflight_keys: Dict[str, asyncio.Future] = {}
     
     @abstractmethod
     async def get(self, cache_key: str) -> Optional[CacheEntry]:
@@ -81,4 +89,45 @@ class CacheInterface(ABC):
         Returns:
             Number of entries removed
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    async def get_and_lock(self, cache_key: str) -> Optional[CacheEntry]:
+        """Retrieve a cached result, claiming the key on a miss.
+        
+        The first caller that misses becomes the producer for the key and must
+        call release() once it has stored (or given up on) the result. Other
+        callers missing on the same key wait for that release and then re-read
+        the cache instead of computing the result again.
+        
+        Only callers sharing this cache instance are coordinated, and
+        CacheKeyGenerator includes the task name in the key, so this only
+        deduplicates same-named tasks run concurrently against one cache, such
+        as separate workflows built from the same template. Tasks within a
+        single workflow have unique names and never share a key.
+        
+        Args:
+            cache_key: The cache key to look up
+            
+        Returns:
+            A valid CacheEntry, or None if the caller now holds the key
+        """
+        inflight = self._inflight_keys
+        while True:
+            entry = await self.get(cache_key)
+            if entry is not None and entry.is_valid():
+                return entry
+            pending = inflight.get(cache_key)
+            if pending is None:
+                inflight[cache_key] = asyncio.get_running_loop().create_future()
+                return None
+            await asyncio.shield(pending)
+    
+    def release(self, cache_key: str) -> None:
+        """Release a key claimed by get_and_lock() and wake up its waiters.
+        
+        Args:
+            cache_key: The cache key to release
+        """
+        pending = self._inflight_keys.pop(cache_key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(None)
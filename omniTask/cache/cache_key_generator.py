@@ -47,7 +47,7 @@ class CacheKeyGenerator:
         # Exclude cache-related and non-deterministic configs
         excluded_keys = {
             'cache_enabled', 'cache_ttl', 'cache_key', 
-            'progress_tracking', 'timeout', 'max_retry'
+            'progress_tracking', 'progress_throttle_ms', 'timeout', 'max_retry'
         }
         
         for key, value in config.items():
@@ -18,6 +18,7 @@ class FileCache(CacheInterface):
             cache_dir: Directory to store cache files
             default_ttl: Default time to live for cache entries
         """
+        super().__init__()
         self.cache_dir = Path(cache_dir)
         self.default_ttl = default_ttl
         self._lock = asyncio.Lock()
@@ -15,6 +15,7 @@ class MemoryCache(CacheInterface):
             max_size: Maximum number of entries to store
             default_ttl: Default time to live for cache entries
         """
+        super().__init__()
         self.max_size = max_size
         self.default_ttl = default_ttl
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
@@ -26,6 +26,7 @@ class RedisCache(CacheInterface):
         if not REDIS_AVAILABLE:
             raise ImportError("redis package is required. Install with: pip install redis")
         
+        super().__init__()
         self.host = host
         self.port = port
         self.db = db
@@ -3,17 +3,15 @@ import importlib
 import os
 import inspect
 import logging
-import subprocess
 import sys
 from urllib.parse import urlparse
-import pkg_resources
 import tempfile
 from urllib.request import urlopen
 from urllib.error import URLError
 from pathlib import Path
 
 from ..models.task_result import TaskResult
-from .task import Task
+from .task import Task, installed_distributions, refresh_installed_distributions
 
 class TaskRegistry:
     """
@@ -48,16 +46,18 @@ class TaskRegistry:
         if not hasattr(task_class, 'library_dependencies'):
             return
 
-        installed = {pkg.key for pkg in pkg_resources.working_set}
-        missing = task_class.library_dependencies - installed
+        missing = task_class.library_dependencies - installed_distributions()
 
         if missing:
+            import subprocess
+
             self.logger.info(f"Installing library dependencies for {task_class.task_name}: {missing}")
             try:
                 subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
             except subprocess.CalledProcessError as e:
                 self.logger.error(f"Failed to install library dependencies for {task_class.task_name}: {e}")
                 raise
+            refresh_installed_distributions()
 
     def register(self, task_class: Type[Task]) -> None:
         """
@@ -1,19 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Set, Union, Callable
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
 from enum import Enum
 import logging
-import pkg_resources
-import subprocess
 import sys
 import re
 import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
 import time
 import json
+import operator
 import ast
+import copy
+import functools
+import inspect
 
 from ..models.task_result import TaskResult, StreamingTaskResult, StreamingYielder, TaskProgress
 from ..cache import CacheInterface, CacheKeyGenerator
+from ..utils.logging import TaskTimestampFilter, TaskLoggerAdapter
+
+_task_logger = logging.getLogger("task")
+_task_logger.addFilter(TaskTimestampFilter())
+
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+_wait_for = asyncio.wait_for
+_perf_counter = time.perf_counter
+_PLACEHOLDER_RE = re.compile(r'\${([^}]+)}')
 
 class TaskStatus(Enum):
     PENDING = "pending"
@@ -24,19 +35,224 @@ class TaskStatus(Enum):
     TIMEOUT = "timeout"
     CONDITION_NOT_MET = "condition_not_met"
 
+# Characters a Python literal can start with; anything else cannot parse,
+# so there is no point handing it to ast.literal_eval.
+_LITERAL_START_CHARS = frozenset("0123456789-+.[{('\"TFNbBrRuU \t\n\r\f\v")
+_LITERAL_CONSTANTS = {"True": True, "False": False, "None": None}
+_LITERAL_CACHE_MAX_LEN = 128
+_SCALAR_LITERAL_TYPES = (str, bytes, int, float, complex, bool, type(None))
+_NOT_A_LITERAL = object()
+_MISSING = object()
+
+@functools.lru_cache(maxsize=2048)
+def _cached_literal_eval(value: str) -> Any:
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return _NOT_A_LITERAL
+
 def safe_literal_eval(value: Any) -> Any:
     if isinstance(value, str):
-        try:
-            return ast.literal_eval(value)
-        except (ValueError, SyntaxError):
+        if not value or value[0] not in _LITERAL_START_CHARS:
+            return value
+        if value in _LITERAL_CONSTANTS:
+            return _LITERAL_CONSTANTS[value]
+        if len(value) > _LITERAL_CACHE_MAX_LEN:
+            try:
+                return ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                return value
+        digits = value[1:] if value[0] == "-" else value
+        # Plain decimal integers; leading zeros are a SyntaxError for literal_eval
+        if digits.isascii() and digits.isdigit() and (digits[0] != "0" or len(digits) == 1):
+            return int(value)
+        result = _cached_literal_eval(value)
+        if result is _NOT_A_LITERAL:
             return value
+        if not isinstance(result, _SCALAR_LITERAL_TYPES):
+            # The cached object is shared (tuples and frozensets may hold mutables), hand
+            # callers their own copy
+            return copy.deepcopy(result)
+        return result
     return value
 
+@functools.lru_cache(maxsize=1024)
+def _parse_relative_path(path: str) -> Tuple[int, str]:
+    """Split a 'prev', 'prevN' or 'prevN.rest' path into (N, rest)."""
+    steps_back = 1
+    remaining_path = ""
+    
+    if len(path) > 4:
+        dot_index = path.find('.')
+        if dot_index != -1:
+            steps_back_str = path[4:dot_index]
+            remaining_path = path[dot_index + 1:]
+            try:
+                steps_back = int(steps_back_str) if steps_back_str else 1
+            except ValueError:
+                raise ValueError(f"Invalid relative path: {path}")
+        else:
+            try:
+                steps_back = int(path[4:])
+            except ValueError:
+                raise ValueError(f"Invalid relative path: {path}")
+    
+    return steps_back, remaining_path
+
+_installed_distributions: Optional[Set[str]] = None
+
+def installed_distributions() -> Set[str]:
+    """Return the normalized names of the installed Python distributions.
+
+    Names are lowercased with runs of '-', '_' and '.' collapsed to '-',
+    matching the keys pkg_resources used to report. The scan runs once per
+    process; call refresh_installed_distributions() after installing packages.
+    """
+    global _installed_distributions
+    if _installed_distributions is None:
+        from importlib import metadata
+
+        names = set()
+        for dist in metadata.distributions():
+            name = dist.metadata["Name"]
+            if name:
+                names.add(re.sub(r"[-_.]+", "-", name).lower())
+        _installed_distributions = names
+    return _installed_distributions
+
+def refresh_installed_distributions() -> None:
+    """Forget the cached distribution names so the next lookup rescans."""
+    global _installed_distributions
+    _installed_distributions = None
+
+class _NoCondition:
+    __slots__ = ()
+
+    def evaluate(self, outputs: Dict[str, Dict[str, Any]]) -> bool:
+        return True
+
+class _UnsupportedCondition:
+    __slots__ = ()
+
+    def evaluate(self, outputs: Dict[str, Dict[str, Any]]) -> bool:
+        return False
+
+_CMP_OPS = {
+    "gt": operator.gt, "gte": operator.ge, "lt": operator.lt, "lte": operator.le,
+    "eq": operator.eq, "ne": operator.ne,
+    ">": operator.gt, ">=": operator.ge, "<": operator.lt, "<=": operator.le,
+    "==": operator.eq, "!=": operator.ne,
+}
+
+class _DictCondition:
+    __slots__ = ('operator', 'value', 'path', 'parts', 'compare')
+
+    def __init__(self, condition: Dict[str, Any]):
+        self.operator = condition.get("operator")
+        self.value = condition.get("value")
+        self.path = condition.get("path")
+        self.parts = self.path.split(".") if isinstance(self.path, str) else None
+        self.compare = _CMP_OPS.get(self.operator)
+
+    def evaluate(self, outputs: Dict[str, Dict[str, Any]]) -> bool:
+        value = self.value
+        if not all([self.operator, value, self.path]):
+            return False
+
+        task_name, key = self.parts
+        if task_name not in outputs:
+            return False
+
+        task_output = outputs[task_name]
+        if key not in task_output:
+            return False
+
+        compare = self.compare
+        return compare(task_output[key], value) if compare else False
+
+
+class _StrCondition:
+    """A parsed "<left> <op> <right>" condition.
+
+    Operands are either JSON literals or references to dependency output
+    written as ``$task``, ``$task.key`` or ``${task.key}``. References are
+    resolved by walking the dependency outputs directly at evaluation time.
+    """
+    __slots__ = ('left', 'op', 'right')
+
+    def __init__(self, left: Tuple[bool, Any], op: Callable[[Any, Any], bool], right: Tuple[bool, Any]):
+        self.left = left
+        self.op = op
+        self.right = right
+
+    @staticmethod
+    def _parse_operand(token: str) -> Optional[Tuple[bool, Any]]:
+        if token.startswith("$"):
+            path = token[2:-1] if token.startswith("${") and token.endswith("}") else token[1:]
+            return True, tuple(path.split("."))
+        try:
+            return False, json.loads(token)
+        except ValueError:
+            return None
+
+    @classmethod
+    def compile(cls, condition: str):
+        parts = condition.split()
+        if len(parts) != 3:
+            return _UnsupportedCondition()
+
+        left, op, right = parts
+        op_fn = _CMP_OPS.get(op)
+        left_spec = cls._parse_operand(left)
+        right_spec = cls._parse_operand(right)
+        if op_fn is None or left_spec is None or right_spec is None:
+            return _UnsupportedCondition()
+        return cls(left_spec, op_fn, right_spec)
+
+    @staticmethod
+    def _resolve(spec: Tuple[bool, Any], outputs: Dict[str, Dict[str, Any]]) -> Any:
+        is_ref, value = spec
+        if not is_ref:
+            return value
+        task_name, *keys = value
+        if task_name not in outputs:
+            return _MISSING
+        current = outputs[task_name]
+        for key in keys:
+            if isinstance(current, dict) and key in current:
+                current = current[key]
+            else:
+                return _MISSING
+        return current
+
+    def evaluate(self, outputs: Dict[str, Dict[str, Any]]) -> bool:
+        left_val = self._resolve(self.left, outputs)
+        right_val = self._resolve(self.right, outputs)
+        if left_val is _MISSING or right_val is _MISSING:
+            return False
+        try:
+            return bool(self.op(left_val, right_val))
+        except TypeError:
+            return False
+
+def _compile_condition(condition: Any):
+    """Build the evaluator for a task condition once, at task construction."""
+    if not condition:
+        return _NoCondition()
+    if isinstance(condition, dict):
+        return _DictCondition(condition)
+    if isinstance(condition, str):
+        return _StrCondition.compile(condition)
+    return _UnsupportedCondition()
+
 class Task(ABC):
     task_name: str = None
     library_dependencies: Set[str] = set()
     default_timeout: Optional[float] = None
     default_max_retry: Optional[int] = 0
+    # Shared by every task class; instances wrap it in a TaskLoggerAdapter
+    # carrying their name instead of registering a logger per task.
+    logger: logging.Logger = _task_logger
 
     @classmethod
     def install(cls) -> None:
@@ -50,21 +266,40 @@ class Task(ABC):
     def __init__(self, name: str, config: Dict[str, Any] = None):
         if not self.task_name:
             raise ValueError(f"Task class {self.__class__.__name__} must define task_name")
+        # Names key every results/dependency dict, so intern them for identity-fast lookups
+        if type(name) is str:
+            name = sys.intern(name)
         self.name = name
         self.config = config or {}
         self.status = TaskStatus.PENDING
+        self.logger = TaskLoggerAdapter(_task_logger, {"task_name": name, "task_type": self.task_name})
         self.result: Optional[TaskResult] = None
-        self.task_dependencies: List[str] = []
-        self.dependency_outputs: Dict[str, Dict[str, Any]] = {}
-        self.dependency_order: List[str] = []
-        self.logger = logging.getLogger(f"task.{name}")
+        self._dependencies: Dict[str, None] = {}
+        self._dependency_list: Optional[List[str]] = None
+        self._dependency_order: Optional[List[str]] = None
+        # Reversed snapshot of dependency_order taken when execution starts
+        self._dep_order_rev: Optional[Tuple[str, ...]] = None
+        self._dependency_outputs: Dict[str, Dict[str, Any]] = {}
+        # Bumped whenever dependency data changes; guards the resolved config cache
+        self._dep_version = 0
+        self._resolved_config_cache: Optional[Dict[str, Any]] = None
+        self._resolved_config_version = -1
+        self._cache_key: Optional[str] = None
+        self._cache_key_version = -1
+        self._cache_lock_key: Optional[str] = None
         self.timeout = self.config.get('timeout', self.default_timeout)
         self.condition = self.config.get('condition')
+        self._condition = _compile_condition(self.condition)
         self.max_retry = self.config.get('max_retry', self.default_max_retry)
         self.retries = 0
         self._progress_callbacks: List[Callable[[TaskProgress], None]] = []
+        self._progress_observer: Optional[Callable[[str, TaskProgress], None]] = None
         self._current_progress: Optional[TaskProgress] = None
         self._progress_enabled = self.config.get('progress_tracking', True)
+        # Templates often emit the key with a null value; treat that as "no throttle"
+        self._progress_throttle_ns = self._parse_progress_throttle(self.config.get('progress_throttle_ms') or 0)
+        self._last_progress_ns = 0
+        self._progress_futures: Set[asyncio.Future] = set()
         self._cache: Optional[CacheInterface] = None
         self._cache_enabled = self.config.get('cache_enabled', False)
         self._cache_ttl = self.config.get('cache_ttl')
@@ -72,11 +307,14 @@ class Task(ABC):
             self._cache_ttl = timedelta(seconds=self._cache_ttl)
 
     def log(self, level: int, message: str, **kwargs) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        # Identity is passed explicitly as well as through the adapter so tasks
+        # that swap self.logger for a plain Logger still get tagged records.
         extra = {
             "task_name": self.name,
             "task_type": self.task_name,
             "status": self.status.value,
-            "timestamp": datetime.now().isoformat(),
             **kwargs
         }
         self.logger.log(level, message, extra=extra)
@@ -105,9 +343,30 @@ class Task(ABC):
         if self._progress_enabled:
             self._progress_callbacks.append(callback)
 
+    def _parse_progress_throttle(self, throttle_ms: Any) -> int:
+        if isinstance(throttle_ms, bool) or not isinstance(throttle_ms, (int, float)):
+            raise ValueError(f"Task {self.name}: progress_throttle_ms must be a number, got {throttle_ms!r}")
+        return max(int(throttle_ms * 1_000_000), 0)
+
+    def set_progress_observer(self, observer: Optional[Callable[[str, TaskProgress], None]]) -> None:
+        """Set the owner-level progress hook, called as ``observer(task_name, progress)``.
+        
+        Unlike progress callbacks this takes the task name, so an owner such as a
+        workflow can share one bound method across all of its tasks.
+        
+        Args:
+            observer: Function taking the task name and a TaskProgress, or None to clear it
+        """
+        self._progress_observer = observer
+
     def update_progress(self, current: int, total: Optional[int] = None, message: str = "") -> None:
         """Update the current progress of the task.
         
+        Callbacks may be plain functions or coroutine functions; coroutines are
+        gathered on the running event loop. When the ``progress_throttle_ms``
+        config is set, intermediate updates arriving faster than that interval
+        only update the stored progress and skip logging and callbacks.
+        
         Args:
             current: Current progress value
             total: Total progress value (optional, defaults to existing total or 100)
@@ -121,15 +380,58 @@ class Task(ABC):
             
         progress = TaskProgress(current=current, total=total, message=message)
         self._current_progress = progress
+
+        if self._progress_throttle_ns and current != total:
+            now = time.monotonic_ns()
+            if now - self._last_progress_ns < self._progress_throttle_ns:
+                return
+            self._last_progress_ns = now
         
-        self.log_info(f"Progress: {progress.percentage:.1f}% ({current}/{total}) - {message}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.log_info(f"Progress: {progress.percentage:.1f}% ({current}/{total}) - {message}")
         
+        observer = self._progress_observer
+        if observer is not None:
+            try:
+                observer(self.name, progress)
+            except Exception as e:
+                self.log_warning(f"Progress callback failed: {e}")
+
+        if not self._progress_callbacks:
+            return
+
+        pending = []
         for callback in self._progress_callbacks:
             try:
-                callback(progress)
+                outcome = callback(progress)
+                if inspect.isawaitable(outcome):
+                    pending.append(outcome)
             except Exception as e:
                 self.log_warning(f"Progress callback failed: {e}")
 
+        if pending:
+            self._dispatch_async_progress(pending)
+
+    def _dispatch_async_progress(self, pending: List[Any]) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            for awaitable in pending:
+                if inspect.iscoroutine(awaitable):
+                    awaitable.close()
+            self.log_warning("Async progress callbacks require a running event loop")
+            return
+
+        async def _gather() -> None:
+            outcomes = await asyncio.gather(*pending, return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    self.log_warning(f"Progress callback failed: {outcome}")
+
+        future = loop.create_task(_gather())
+        self._progress_futures.add(future)
+        future.add_done_callback(self._progress_futures.discard)
+
     def get_progress(self) -> Optional[TaskProgress]:
         """Get the current progress of the task.
         
@@ -165,14 +467,23 @@ class Task(ABC):
     def get_cache_key(self) -> str:
         """Generate a cache key for this task.
         
+        The key is reused until the dependency outputs change.
+        
         Returns:
             The cache key string
         """
-        return CacheKeyGenerator.generate_key(self)
+        if self._cache_key_version != self._dep_version:
+            self._cache_key = CacheKeyGenerator.generate_key(self)
+            self._cache_key_version = self._dep_version
+        return self._cache_key
     
-    async def get_cached_result(self) -> Optional[TaskResult]:
+    async def get_cached_result(self, lock: bool = False) -> Optional[TaskResult]:
         """Get cached result if available and valid.
         
+        Args:
+            lock: Claim the cache key on a miss so concurrent duplicates wait for
+                this task's result. The claim is dropped by _release_cache_lock().
+        
         Returns:
             Cached TaskResult if available, None otherwise
         """
@@ -182,7 +493,12 @@ class Task(ABC):
         cache_key = self.get_cache_key()
         
         try:
-            cache_entry = await self._cache.get(cache_key)
+            if lock:
+                cache_entry = await self._cache.get_and_lock(cache_key)
+                if cache_entry is None:
+                    self._cache_lock_key = cache_key
+            else:
+                cache_entry = await self._cache.get(cache_key)
             if cache_entry and cache_entry.is_valid():
                 self.log_info(f"Cache hit for task {self.name}")
                 return cache_entry.result
@@ -191,6 +507,11 @@ class Task(ABC):
         
         return None
     
+    def _release_cache_lock(self) -> None:
+        if self._cache_lock_key is not None:
+            self._cache.release(self._cache_lock_key)
+            self._cache_lock_key = None
+
     async def cache_result(self, result: TaskResult) -> None:
         """Cache the task result if caching is enabled.
         
@@ -229,74 +550,27 @@ class Task(ABC):
             return False
 
     def _evaluate_condition(self) -> bool:
-        if not self.condition:
-            return True
-
-        if isinstance(self.condition, dict):
-            operator = self.condition.get("operator")
-            value = self.condition.get("value")
-            path = self.condition.get("path")
-
-            if not all([operator, value, path]):
-                return False
-
-            task_name, key = path.split(".")
-            if task_name not in self.dependency_outputs:
-                return False
-
-            task_output = self.dependency_outputs[task_name]
-            if key not in task_output:
-                return False
-
-            actual_value = task_output[key]
-            if operator == "gt":
-                return actual_value > value
-            elif operator == "gte":
-                return actual_value >= value
-            elif operator == "lt":
-                return actual_value < value
-            elif operator == "lte":
-                return actual_value <= value
-            elif operator == "eq":
-                return actual_value == value
-            elif operator == "ne":
-                return actual_value != value
-            return False
-
-        if isinstance(self.condition, str):
-            condition = self.condition
-            for task_name, output in self.dependency_outputs.items():
-                condition = condition.replace(f"${task_name}", json.dumps(output))
-            
-            parts = condition.split()
-            if len(parts) != 3:
-                return False
-                
-            left, op, right = parts
-            try:
-                left_val = json.loads(left)
-                right_val = json.loads(right)
-                
-                if op == ">":
-                    return left_val > right_val
-                elif op == ">=":
-                    return left_val >= right_val
-                elif op == "<":
-                    return left_val < right_val
-                elif op == "<=":
-                    return left_val <= right_val
-                elif op == "==":
-                    return left_val == right_val
-                elif op == "!=":
-                    return left_val != right_val
-                return False
-            except (json.JSONDecodeError, ValueError):
-                return False
-
-        return False
+        return self._condition.evaluate(self.dependency_outputs)
+
+    async def _execute_with_deadline(self) -> TaskResult:
+        # asyncio.timeout() cancels the running task directly instead of
+        # wrapping execute() in a separate Task like wait_for does.
+        if _HAS_ASYNCIO_TIMEOUT:
+            async with asyncio.timeout(self.timeout):
+                return await self.execute()
+        return await _wait_for(self.execute(), timeout=self.timeout)
+
+    async def _run_once(self, start_time: float) -> TaskResult:
+        # The coroutine is created inline so no reference to it outlives the await
+        if self.timeout is None:
+            result = await self.execute()
+        else:
+            result = await self._execute_with_deadline()
+        result.execution_time = _perf_counter() - start_time
+        return result
 
     async def execute_with_timeout(self) -> TaskResult:
-        if not self._evaluate_condition():
+        if not self._condition.evaluate(self.dependency_outputs):
             self.status = TaskStatus.CONDITION_NOT_MET
             self.logger.info(f"Task {self.name} skipped due to condition not met")
             return TaskResult(
@@ -306,49 +580,40 @@ class Task(ABC):
                 progress=self._current_progress
             )
 
+        self._dep_order_rev = tuple(reversed(self.dependency_order))
+
         # Check cache first
-        cached_result = await self.get_cached_result()
+        cached_result = await self.get_cached_result(lock=True)
         if cached_result is not None:
             self.status = TaskStatus.COMPLETED
             self.result = cached_result
             return cached_result
 
-        start_time = time.time()
-        result = None
-        
-        if self.timeout is None:
-            while self.retries <= self.max_retry:
-                result = await self.execute()
-                result.execution_time = time.time() - start_time
-                self.retries += 1
-                if result.success or self.retries > self.max_retry:
-                    break
-
-            if result and self.retries > 1:
-                result.retries = self.retries
-
-            # Cache successful result
-            if result and result.success:
-                await self.cache_result(result)
-
-            return result if result else TaskResult(
-                success=False,
-                output={},
-                error=RuntimeError("Task execution failed"),
-                execution_time=time.time() - start_time,
-                progress=self._current_progress
-            )
-
         try:
-            while self.retries <= self.max_retry:
-                result = await asyncio.wait_for(self.execute(), timeout=self.timeout)
-                result.execution_time = time.time() - start_time
-                self.retries += 1
-                if result.success or self.retries > self.max_retry:
-                    break
+            return await self._execute_and_cache()
+        finally:
+            self._release_cache_lock()
 
-            if result and self.retries > 1:
-                result.retries = self.retries
+    async def _execute_and_cache(self) -> TaskResult:
+        start_time = _perf_counter()
+        
+        try:
+            if self.max_retry == 0 and self.retries == 0:
+                # No retries configured: run exactly once without the retry bookkeeping
+                result = await self._run_once(start_time)
+                self.retries = 1
+            else:
+                result = None
+                run_once = self._run_once
+                max_retry = self.max_retry
+                while self.retries <= max_retry:
+                    result = await run_once(start_time)
+                    self.retries += 1
+                    if result.success or self.retries > max_retry:
+                        break
+
+                if result and self.retries > 1:
+                    result.retries = self.retries
 
             # Cache successful result
             if result and result.success:
@@ -358,16 +623,18 @@ class Task(ABC):
                 success=False,
                 output={},
                 error=RuntimeError("Task execution failed"),
-                execution_time=time.time() - start_time,
+                execution_time=_perf_counter() - start_time,
                 progress=self._current_progress
             )
         except asyncio.TimeoutError:
+            if self.timeout is None:
+                raise
             self.logger.error(f"Task {self.name} timed out after {self.timeout} seconds")
             return TaskResult(
                 success=False,
                 output={},
                 error=TimeoutError(f"Task execution timed out after {self.timeout} seconds"),
-                execution_time=time.time() - start_time,
+                execution_time=_perf_counter() - start_time,
                 retries=self.retries if self.retries > 1 else None,
                 progress=self._current_progress
             )
@@ -382,41 +649,62 @@ class Task(ABC):
         if not cls.library_dependencies:
             return
 
-        installed = {pkg.key for pkg in pkg_resources.working_set}
-        missing = cls.library_dependencies - installed
+        missing = cls.library_dependencies - installed_distributions()
 
         if missing:
+            import subprocess
+
             cls.logger.info(f"Installing dependencies for {cls.task_name}: {missing}")
             try:
                 subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
             except subprocess.CalledProcessError as e:
                 raise RuntimeError(f"Failed to install dependencies for {cls.task_name}: {e}")
+            refresh_installed_distributions()
+
+    def _resolve_placeholder(self, match: "re.Match") -> str:
+        expr = match.group(1)
+        task_name, *path = expr.split('.')
+        if task_name not in self.dependency_outputs:
+            raise ValueError(f"Task {task_name} not found in dependencies")
+
+        current = self.dependency_outputs[task_name]
+        for part in path:
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+            else:
+                raise ValueError(f"Path {expr} not found in task output")
+
+        return str(current)
+
+    def _resolve_value(self, value: Any) -> Any:
+        if isinstance(value, str) and "$" in value:
+            value = _PLACEHOLDER_RE.sub(self._resolve_placeholder, value)
+        return safe_literal_eval(value)
 
     def _resolve_config(self) -> Dict[str, Any]:
-        resolved_config = {}
-        for key, value in self.config.items():
-            if isinstance(value, str):
-                matches = re.findall(r'\${([^}]+)}', value)
-                if matches:
-                    for match in matches:
-                        task_name, *path = match.split('.')
-                        if task_name not in self.dependency_outputs:
-                            raise ValueError(f"Task {task_name} not found in dependencies")
-                        
-                        current = self.dependency_outputs[task_name]
-                        for part in path:
-                            if isinstance(current, dict) and part in current:
-                                current = current[part]
-                            else:
-                                raise ValueError(f"Path {match} not found in task output")
-                        
-                        value = value.replace(f"${{{match}}}", str(current))
-            resolved_config[key] = safe_literal_eval(value)
-        return resolved_config
+        return {key: self._resolve_value(value) for key, value in self.config.items()}
+
+    def get_resolved_config(self) -> Dict[str, Any]:
+        """Return the task config with all placeholders resolved.
+        
+        The result is cached until the dependency outputs change, so treat the
+        returned dictionary as read-only.
+        
+        Returns:
+            Dict[str, Any]: The resolved configuration
+        """
+        if self._resolved_config_version != self._dep_version:
+            self._resolved_config_cache = self._resolve_config()
+            self._resolved_config_version = self._dep_version
+        return self._resolved_config_cache
 
     def get_config(self, key: str, default: Any = None) -> Any:
-        resolved_config = self._resolve_config()
-        return resolved_config.get(key, default)
+        if self._resolved_config_version == self._dep_version:
+            return self._resolved_config_cache.get(key, default)
+        # Cold cache: resolve only the requested key instead of the whole config
+        if key not in self.config:
+            return default
+        return self._resolve_value(self.config[key])
 
     def add_dependency(self, task_name: str) -> None:
         """Adds a task dependency and updates the dependency order.
@@ -424,9 +712,90 @@ class Task(ABC):
         Args:
             task_name: Name of the task to add as a dependency
         """
-        if task_name not in self.task_dependencies:
-            self.task_dependencies.append(task_name)
-            self.dependency_order.append(task_name)
+        if task_name not in self._dependencies:
+            self._dependencies[task_name] = None
+            self._dependency_list = None
+            self._dep_order_rev = None
+            self._bump_dep_version()
+            if self._dependency_order is not None:
+                self._dependency_order.append(task_name)
+
+    def _bump_dep_version(self) -> None:
+        # Every memo derived from dependency state (resolved config, cache key)
+        # records the version it was built at, so one increment invalidates
+        # them all; the stale values are dropped so they can be collected.
+        self._dep_version += 1
+        self._resolved_config_cache = None
+        self._cache_key = None
+
+    @property
+    def dependency_outputs(self) -> Dict[str, Dict[str, Any]]:
+        """Outputs of the dependency tasks, keyed by task name."""
+        return self._dependency_outputs
+
+    @dependency_outputs.setter
+    def dependency_outputs(self, outputs: Dict[str, Dict[str, Any]]) -> None:
+        self._dependency_outputs = outputs
+        self._bump_dep_version()
+
+    def set_dependency_output(self, task_name: str, output: Dict[str, Any]) -> None:
+        """Record the output of a single dependency.
+        
+        Args:
+            task_name: Name of the dependency task or task group
+            output: Output produced by that dependency
+        """
+        self._dependency_outputs[task_name] = output
+        self._bump_dep_version()
+
+    @property
+    def task_dependencies(self) -> List[str]:
+        """Names of the tasks this task depends on, in insertion order."""
+        if self._dependency_list is None:
+            self._dependency_list = list(self._dependencies)
+        return self._dependency_list
+
+    @task_dependencies.setter
+    def task_dependencies(self, dependencies: List[str]) -> None:
+        self._dependencies = dict.fromkeys(dependencies)
+        self._dependency_list = None
+        self._dep_order_rev = None
+        self._bump_dep_version()
+
+    @property
+    def dependency_order(self) -> List[str]:
+        """Order used to resolve relative 'prev' paths; defaults to task_dependencies."""
+        if self._dependency_order is None:
+            self._dependency_order = list(self._dependencies)
+        return self._dependency_order
+
+    @dependency_order.setter
+    def dependency_order(self, order: List[str]) -> None:
+        self._dependency_order = list(order)
+        self._dep_order_rev = None
+
+    def _resolve_relative_path(self, path: str) -> str:
+        """Rewrite a 'prev'/'prevN' path to the dependency name it refers to."""
+        if path is None:
+            path = "prev"
+
+        if path.startswith("prev"):
+            steps_back, remaining_path = _parse_relative_path(path)
+            
+            dep_order_rev = self._dep_order_rev
+            if dep_order_rev is None:
+                dep_order_rev = tuple(reversed(self.dependency_order))
+
+            if not dep_order_rev:
+                raise ValueError("No dependencies available for relative path")
+            
+            if steps_back > len(dep_order_rev):
+                raise ValueError(f"Not enough previous tasks for path: {path}")
+            
+            task_name = dep_order_rev[steps_back - 1]
+            path = f"{task_name}.{remaining_path}" if remaining_path else task_name
+
+        return path
 
     def get_output(self, path: str = None) -> Any:
         """Retrieves output from a dependent task using a path string.
@@ -445,49 +814,17 @@ class Task(ABC):
         Raises:
             ValueError: If the path is invalid or the value doesn't exist
         """
-        if path is None:
-            path = "prev"
-
-        if path.startswith("prev"):
-            steps_back = 1
-            remaining_path = ""
-            
-            if len(path) > 4:
-                dot_index = path.find('.')
-                if dot_index != -1:
-                    steps_back_str = path[4:dot_index]
-                    remaining_path = path[dot_index + 1:]
-                    try:
-                        steps_back = int(steps_back_str) if steps_back_str else 1
-                    except ValueError:
-                        raise ValueError(f"Invalid relative path: {path}")
-                else:
-                    try:
-                        steps_back = int(path[4:])
-                    except ValueError:
-                        raise ValueError(f"Invalid relative path: {path}")
-            
-            if not self.dependency_order:
-                raise ValueError("No dependencies available for relative path")
-            
-            if steps_back > len(self.dependency_order):
-                raise ValueError(f"Not enough previous tasks for path: {path}")
-            
-            task_name = self.dependency_order[-steps_back]
-            path = f"{task_name}.{remaining_path}" if remaining_path else task_name
+        path = self._resolve_relative_path(path)
 
-        parts = path.split('.')
-        task_name = parts[0]
+        task_name, sep, rest = path.partition('.')
 
         if task_name not in self.dependency_outputs:
             raise ValueError(f"No output available for task: {task_name}")
 
         current = self.dependency_outputs[task_name]
         
-        if len(parts) == 1:
-            return current
-
-        for part in parts[1:]:
+        while sep:
+            part, sep, rest = rest.partition('.')
             if isinstance(current, dict) and part in current:
                 current = current[part]
             else:
@@ -498,13 +835,46 @@ class Task(ABC):
     def get_outputs(self, paths: List[str]) -> Dict[str, Any]:
         """Retrieves multiple outputs from dependent tasks.
         
+        Paths sharing a prefix are resolved with a single descent into the
+        dependency outputs instead of one walk per path.
+        
         Args:
             paths: List of paths to retrieve values from
             
         Returns:
             Dict[str, Any]: Dictionary mapping paths to their values
         """
-        return {path: self.get_output(path) for path in paths}
+        resolved: Dict[str, Tuple[str, ...]] = {}
+        trie: Dict[str, Dict] = {}
+        for path in paths:
+            parts = tuple(self._resolve_relative_path(path).split('.'))
+            resolved[path] = parts
+            node = trie
+            for part in parts:
+                node = node.setdefault(part, {})
+
+        values: Dict[Tuple[str, ...], Any] = {}
+        stack = []
+        for task_name, node in trie.items():
+            if task_name not in self.dependency_outputs:
+                raise ValueError(f"No output available for task: {task_name}")
+            stack.append(((task_name,), self.dependency_outputs[task_name], node))
+
+        while stack:
+            prefix, current, node = stack.pop()
+            values[prefix] = current
+            for part, child in node.items():
+                if isinstance(current, dict) and part in current:
+                    stack.append((prefix + (part,), current[part], child))
+                else:
+                    failed = prefix + (part,)
+                    full_path = next(
+                        '.'.join(parts) for parts in resolved.values()
+                        if parts[:len(failed)] == failed
+                    )
+                    raise ValueError(f"Path '{full_path}' not found in task output")
+
+        return {path: values[parts] for path, parts in resolved.items()}
 
     @abstractmethod
     async def execute(self) -> TaskResult:
@@ -561,7 +931,7 @@ class StreamingTask(Task):
 
     async def execute_with_timeout(self) -> TaskResult:
         """Override to handle streaming execution."""
-        if not self._evaluate_condition():
+        if not self._condition.evaluate(self.dependency_outputs):
             self.status = TaskStatus.CONDITION_NOT_MET
             self.logger.info(f"Task {self.name} skipped due to condition not met")
             result = TaskResult(
@@ -574,12 +944,13 @@ class StreamingTask(Task):
                 await self.yielder.complete(result)
             return result
 
-        start_time = time.time()
+        self._dep_order_rev = tuple(reversed(self.dependency_order))
+        start_time = _perf_counter()
         
         try:
             if self._streaming_enabled and self.yielder:
                 result = await self.execute_streaming()
-                result.execution_time = time.time() - start_time
+                result.execution_time = _perf_counter() - start_time
                 await self.yielder.complete(result)
                 return result
             else:
@@ -590,7 +961,7 @@ class StreamingTask(Task):
                 success=False,
                 output={},
                 error=e,
-                execution_time=time.time() - start_time,
+                execution_time=_perf_counter() - start_time,
                 progress=self._current_progress
             )
             if self.yielder:
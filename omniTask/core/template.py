@@ -1,8 +1,11 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import yaml
 import json
 import os
-from pathlib import Path
+import copy
+import functools
+import hashlib
+from collections import OrderedDict
 from datetime import timedelta
 from ..cache import FileCache
 from .workflow import Workflow
@@ -10,22 +13,67 @@ from .registry import TaskRegistry
 from ..models.task_group import TaskGroupConfig
 from ..utils.workflow_checker import WorkflowChecker
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+@functools.lru_cache(maxsize=128)
+def _parse_template_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # mtime_ns and size are only part of the cache key so edited files get re-parsed
+    if path.endswith('.yaml') or path.endswith('.yml'):
+        # libyaml detects the encoding itself, so skip Python's text decoding layer
+        with open(path, 'rb') as f:
+            return yaml.load(f, Loader=_SafeLoader)
+    elif path.endswith('.json'):
+        if _orjson is not None:
+            with open(path, 'rb') as f:
+                return _orjson.loads(f.read())
+        with open(path, 'r') as f:
+            return json.load(f)
+    else:
+        raise ValueError("Template file must be YAML or JSON")
+
+def _template_digest(template_data: Any) -> Optional[str]:
+    try:
+        canonical = json.dumps(template_data, sort_keys=True, separators=(',', ':'))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
 class WorkflowTemplate:
-    def __init__(self, template_path: str):
-        self.template_path = template_path
-        self.template_data = self._load_template()
+    # (template digest, task classes) pairs that already passed WorkflowChecker, least
+    # recently used first; capped so generated templates cannot pin task classes forever
+    _validated: 'OrderedDict[Tuple[str, Tuple[type, ...]], None]' = OrderedDict()
+    _validated_maxsize = 128
+
+    def __init__(self, template_path: Optional[str] = None, *, template_data: Optional[Dict[str, Any]] = None):
+        if template_data is not None:
+            self.template_path = "<dict>"
+            self.template_data = template_data
+        elif template_path is None:
+            raise ValueError("Either template_path or template_data must be provided")
+        else:
+            self.template_path = template_path
+            self.template_data = self._load_template()
 
     def _load_template(self) -> Dict[str, Any]:
         if not os.path.exists(self.template_path):
             raise FileNotFoundError(f"Template file not found: {self.template_path}")
 
-        with open(self.template_path, 'r') as f:
-            if self.template_path.endswith('.yaml') or self.template_path.endswith('.yml'):
-                return yaml.safe_load(f)
-            elif self.template_path.endswith('.json'):
-                return json.load(f)
-            else:
-                raise ValueError("Template file must be YAML or JSON")
+        st = os.stat(self.template_path)
+        parsed = _parse_template_file(os.path.abspath(self.template_path), st.st_mtime_ns, st.st_size)
+        return copy.deepcopy(parsed)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        _parse_template_file.cache_clear()
+        cls._validated.clear()
 
     def _validate_condition(self, condition: Any) -> None:
         if isinstance(condition, str):
@@ -85,9 +133,31 @@ class WorkflowTemplate:
         else:
             raise ValueError(f"Unsupported cache type: {cache_type}")
 
+    def _build_group_config(self, group_name: str, group_config: Dict[str, Any]) -> TaskGroupConfig:
+        if not isinstance(group_config.get('for_each'), str):
+            raise ValueError(f"Task group {group_name} must specify a valid for_each path")
+
+        group_type = group_config.get('type')
+        group_for_each = group_config.get('for_each')
+        
+        if not group_type or not group_for_each:
+            raise ValueError(f"Task group {group_name} must specify both 'type' and 'for_each'")
+        
+        return TaskGroupConfig(
+            type=group_type,
+            for_each=group_for_each,
+            config_template=group_config.get('config_template', {}),
+            max_concurrent=group_config.get('max_concurrent', 10),
+            error_handling=group_config.get('error_handling'),
+            streaming_enabled=group_config.get('streaming_enabled', False),
+            deduplicate=group_config.get('deduplicate', False)
+        )
+
     def create_workflow(self, registry: Optional[TaskRegistry] = None) -> Workflow:
         if not isinstance(self.template_data, dict):
             raise ValueError("Invalid template format: root must be a dictionary")
+        # Hashed per call: template_data is public and may have been edited since the last one
+        template_hash = _template_digest(self.template_data)
 
         workflow_name = self.template_data.get('name')
         if not workflow_name:
@@ -101,18 +171,23 @@ class WorkflowTemplate:
         if cache_config:
             self._configure_cache(workflow, cache_config)
 
+        for task_name, task_config in tasks.items():
+            if isinstance(task_config, dict) and 'for_each' in task_config:
+                workflow.add_task_group(task_name, self._build_group_config(task_name, task_config))
+
         for task_name, task_config in tasks.items():
             if not isinstance(task_config, dict):
                 raise ValueError(f"Invalid task configuration for {task_name}")
 
-            if 'for_each' in task_config:
+            if task_name in workflow.task_groups:
                 continue
 
             task_type = task_config.get('type')
             if not task_type:
                 raise ValueError(f"Task {task_name} must specify a type")
 
-            config = task_config.get('config', {})
+            # Copied so the template (and its digest) stays as written across calls
+            config = dict(task_config.get('config', {}))
             
             if 'condition' in task_config:
                 self._validate_condition(task_config['condition'])
@@ -146,78 +221,34 @@ class WorkflowTemplate:
 
             task = workflow.create_task(task_type, task_name, config)
 
-            task_deps = set()
-            
-            if 'dependencies' in task_config:
-                task_deps.update(task_config['dependencies'])
-            
-            if task_name in global_dependencies:
-                task_deps.update(global_dependencies[task_name])
+            for dep in task_config.get('dependencies', ()):
+                task.add_dependency(dep)
             
-            for dep in task_deps:
-                if dep in tasks and 'for_each' in tasks[dep]:
-                    if dep not in workflow.task_groups:
-                        group_config = tasks[dep]
-                        group_type = group_config.get('type')
-                        group_for_each = group_config.get('for_each')
-                        
-                        if not group_type or not group_for_each:
-                            raise ValueError(f"Task group {dep} must specify both 'type' and 'for_each'")
-                        
-                        group = TaskGroupConfig(
-                            type=group_type,
-                            for_each=group_for_each,
-                            config_template=group_config.get('config_template', {}),
-                            max_concurrent=group_config.get('max_concurrent', 10),
-                            error_handling=group_config.get('error_handling'),
-                            streaming_enabled=group_config.get('streaming_enabled', False)
-                        )
-                        workflow.add_task_group(dep, group)
+            for dep in global_dependencies.get(task_name, ()):
                 task.add_dependency(dep)
 
-        for group_name, group_config in tasks.items():
-            if not isinstance(group_config, dict):
-                continue
-
-            if 'for_each' not in group_config:
-                continue
-
-            if group_name not in workflow.task_groups:
-                if not isinstance(group_config.get('for_each'), str):
-                    raise ValueError(f"Task group {group_name} must specify a valid for_each path")
-
-                group_type = group_config.get('type')
-                group_for_each = group_config.get('for_each')
-                
-                if not group_type or not group_for_each:
-                    raise ValueError(f"Task group {group_name} must specify both 'type' and 'for_each'")
-                
-                group = TaskGroupConfig(
-                    type=group_type,
-                    for_each=group_for_each,
-                    config_template=group_config.get('config_template', {}),
-                    max_concurrent=group_config.get('max_concurrent', 10),
-                    error_handling=group_config.get('error_handling'),
-                    streaming_enabled=group_config.get('streaming_enabled', False)
-                )
-                workflow.add_task_group(group_name, group)
-
-        workflow_checker = WorkflowChecker(workflow)
-        validation_errors = workflow_checker.check_workflow()
-        
-        if validation_errors:
-            error_message = "Workflow validation failed with the following errors:\n" + "\n".join(f"- {error}" for error in validation_errors)
-            raise ValueError(error_message)
+        # The checker inspects task class sources, so a template is only known-good per set of classes
+        validation_key = None
+        if template_hash is not None:
+            validation_key = (template_hash, tuple(type(task) for task in workflow.tasks.values()))
+        validated = WorkflowTemplate._validated
+        if validation_key is not None and validation_key in validated:
+            validated.move_to_end(validation_key)
+        else:
+            workflow_checker = WorkflowChecker(workflow)
+            validation_errors = workflow_checker.check_workflow()
+            
+            if validation_errors:
+                error_message = "Workflow validation failed with the following errors:\n" + "\n".join(f"- {error}" for error in validation_errors)
+                raise ValueError(error_message)
+            if validation_key is not None:
+                validated[validation_key] = None
+                if len(validated) > WorkflowTemplate._validated_maxsize:
+                    validated.popitem(last=False)
 
         return workflow
 
     @classmethod
     def from_dict(cls, template_data: Dict[str, Any]) -> 'WorkflowTemplate':
-        temp_file = Path('temp_template.yaml')
-        try:
-            with open(temp_file, 'w') as f:
-                yaml.dump(template_data, f)
-            return cls(str(temp_file))
-        finally:
-            if temp_file.exists():
-                temp_file.unlink() 
\ No newline at end of file
+        # Tasks share nested config values with the template, so keep the caller's dict untouched
+        return cls(template_data=copy.deepcopy(template_data))
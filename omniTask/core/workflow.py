@@ -1,14 +1,16 @@
-from typing import Dict, List, Any, Callable, Optional, Set
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
 import logging
-from datetime import datetime, timedelta
-import time
+from datetime import timedelta
 import asyncio
+from collections import deque
 from ..models.task_result import TaskResult, StreamingTaskResult, StreamingYielder, TaskProgress
 from ..models.task_group import TaskGroupConfig, TaskGroup, StreamingTaskGroup
 from .task import Task, TaskStatus, StreamingTask
 from .registry import TaskRegistry
 from ..cache import CacheInterface, MemoryCache
 
+_MISSING = object()
+
 class Workflow:
     """
     A workflow is a collection of tasks that are executed in a specific order based on their dependencies.
@@ -35,9 +37,18 @@ class Workflow:
         self._streaming_task_groups: Dict[str, StreamingTaskGroup] = {}
         self._progress_callbacks: List[Callable[[str, TaskProgress], None]] = []
         self._workflow_progress: Dict[str, TaskProgress] = {}
+        self._completed_progress_count = 0
         self._progress_enabled = True
         self._cache: Optional[CacheInterface] = None
         self._cache_enabled = False
+        self._max_concurrent: Optional[int] = None
+        self._task_semaphore: Optional[asyncio.Semaphore] = None
+        self._extract_cache: Dict[Tuple[str, str], List[Any]] = {}
+        self._graph_dirty = True
+        self._graph_sources: Dict[str, Any] = {}
+        self._indegree: Dict[str, int] = {}
+        self._cyclic_nodes: List[str] = []
+        self._streaming_dependents: Dict[str, List[str]] = {}
 
     def add_task(self, task: Task) -> None:
         """
@@ -52,10 +63,12 @@ class Workflow:
         if task.name in self.tasks:
             raise ValueError(f"Task with name {task.name} already exists in workflow")
         self.tasks[task.name] = task
+        self._register_dependencies(task.name, task.task_dependencies)
+        self._graph_sources[task.name] = task.task_dependencies
+        self._graph_dirty = True
 
         if self._progress_enabled:
-            task_name = task.name  # Capture the task name to avoid closure issues
-            task.add_progress_callback(lambda progress, name=task_name: self._on_task_progress(name, progress))
+            task.set_progress_observer(self._on_task_progress)
         
         # Set up caching if enabled
         if self._cache_enabled and self._cache:
@@ -75,6 +88,30 @@ class Workflow:
         else:
             group = TaskGroup(name, config)
             self.task_groups[name] = group
+        if config.path_parts:
+            self._register_dependencies(name, (config.path_parts[0],))
+            self._graph_sources[name] = config.path_parts
+        self._graph_dirty = True
+
+    def remove_task(self, name: str) -> Task:
+        """
+        Remove a task from the workflow.
+
+        Args:
+            name (str): Name of the task to remove
+
+        Returns:
+            Task: The removed task
+
+        Raises:
+            ValueError: If no task with that name exists in the workflow
+        """
+        if name not in self.tasks:
+            raise ValueError(f"Task {name} not found")
+        task = self.tasks.pop(name)
+        self._unregister_dependencies(name)
+        self._graph_dirty = True
+        return task
 
     def register_function(self, func: Callable, name: Optional[str] = None) -> None:
         self.registry.register_function(func, name)
@@ -92,15 +129,14 @@ class Workflow:
         self.add_task(task)
         return task
 
-    def _extract_items_from_output(self, result: TaskResult, path: str) -> List[Any]:
+    def _extract_items_from_output(self, result: TaskResult, path: str, parts: Optional[Tuple[str, ...]] = None) -> List[Any]:
         if not result.success:
             raise ValueError(f"Cannot extract items from failed task result: {result.error}")
         
         current = result.output
-        for part in path.split('.'):
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
+        for part in (path.split('.') if parts is None else parts):
+            current = current.get(part, _MISSING) if isinstance(current, dict) else _MISSING
+            if current is _MISSING:
                 raise ValueError(f"Path {path} not found in task output")
         
         if not isinstance(current, list):
@@ -128,94 +164,143 @@ class Workflow:
             tasks.append(task)
         
         results = {}
-        semaphore = asyncio.Semaphore(group_config.max_concurrent)
-        
-        async def execute_task(task: Task) -> None:
-            async with semaphore:
-                try:
-                    result = await task.execute_with_timeout()
-                    results[task.name] = result
-                except Exception as e:
-                    results[task.name] = TaskResult(success=False, output={}, error=e)
-        
-        await asyncio.gather(
-            *(execute_task(task) for task in tasks),
-            return_exceptions=True
-        )
+        
+        async def run_task(task: Task) -> None:
+            try:
+                result = await task.execute_with_timeout()
+                results[task.name] = result
+            except Exception as e:
+                results[task.name] = TaskResult(success=False, output={}, error=e)
+        
+        limit = group_config.max_concurrent
+        if 0 < limit < len(tasks):
+            remaining = iter(tasks)
+            
+            async def worker() -> None:
+                for task in remaining:
+                    await run_task(task)
+            
+            runners = [worker() for _ in range(limit)]
+        else:
+            runners = [run_task(task) for task in tasks]
+        
+        await asyncio.gather(*runners, return_exceptions=True)
         return results
 
-    def _extract_from_path(self, data, path):
-        parts = path.split(".")
-        current = data
-        for part in parts:
-            if part == "output" and isinstance(current, dict) and "output" in current:
-                current = current["output"]
-            elif part in current:
-                current = current[part]
+    def _register_dependencies(self, node_name: str, deps) -> None:
+        """Point node_name at deps in the dependency graph, dropping its previous edges."""
+        for dep in self.task_dependencies.get(node_name, ()):
+            dependents = self.task_dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(node_name)
+        deps = set(deps)
+        self.task_dependencies[node_name] = deps
+        for dep in deps:
+            dependents = self.task_dependents.get(dep)
+            if dependents is None:
+                self.task_dependents[dep] = {node_name}
             else:
-                if part in current:
-                    current = current[part]
-                else:
-                    raise KeyError(f"Path part '{part}' not found in {current}")
-        return current
+                dependents.add(node_name)
+
+    def _unregister_dependencies(self, node_name: str) -> None:
+        for dep in self.task_dependencies.pop(node_name, ()):
+            dependents = self.task_dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(node_name)
+        self._graph_sources.pop(node_name, None)
+
+    def _ensure_dependency_graph(self) -> None:
+        """Re-link only the tasks and groups whose dependencies changed since the last run."""
+        changed = self._graph_dirty
+        # task_dependencies returns the same list object until the task's dependencies change
+        for task_name, task in self.tasks.items():
+            deps = task.task_dependencies
+            if self._graph_sources.get(task_name) is not deps:
+                self._register_dependencies(task_name, deps)
+                self._graph_sources[task_name] = deps
+                changed = True
+        for group_name, group in self.task_groups.items():
+            path_parts = group.config.path_parts
+            if self._graph_sources.get(group_name) is not path_parts:
+                # Task groups depend on the task specified in their for_each path
+                self._register_dependencies(group_name, (path_parts[0],))
+                self._graph_sources[group_name] = path_parts
+                changed = True
+        if changed:
+            self._refresh_graph_order()
+            self._graph_dirty = False
 
     def _build_dependency_graph(self) -> None:
+        """Rebuild the whole dependency graph from scratch."""
         self.task_dependencies = {}
         self.task_dependents = {}
-        
-        # Build dependencies for regular tasks
-        for task_name, task in self.tasks.items():
-            self.task_dependencies[task_name] = set(task.task_dependencies)
-            for dep in task.task_dependencies:
-                if dep not in self.task_dependents:
-                    self.task_dependents[dep] = set()
-                self.task_dependents[dep].add(task_name)
-        
-        # Build dependencies for task groups
-        for group_name, group in self.task_groups.items():
-            # Task groups depend on the task specified in their for_each path
-            for_each_parts = group.config.for_each.split('.')
-            parent_task = for_each_parts[0]
-            
-            if parent_task not in self.task_dependents:
-                self.task_dependents[parent_task] = set()
-            self.task_dependents[parent_task].add(group_name)
-            
-            # Initialize task group dependencies
-            self.task_dependencies[group_name] = {parent_task}
-
-    def _get_ready_tasks(self, completed_tasks: Set[str]) -> Set[str]:
-        ready = set()
-        
-        # Check regular tasks
-        for task_name in self.tasks:
-            if task_name not in completed_tasks and task_name not in ready:
-                deps = self.task_dependencies.get(task_name, set())
-                if all(dep in completed_tasks for dep in deps):
-                    ready.add(task_name)
-        
-        # Check task groups
-        for group_name in self.task_groups:
-            if group_name not in completed_tasks and group_name not in ready:
-                deps = self.task_dependencies.get(group_name, set())
-                if all(dep in completed_tasks for dep in deps):
-                    ready.add(group_name)
-                    
-        return ready
+        self._graph_sources = {}
+        self._graph_dirty = True
+        self._ensure_dependency_graph()
+
+    def _refresh_graph_order(self) -> None:
+        self._indegree = {name: len(deps) for name, deps in self.task_dependencies.items()}
+
+        self._streaming_dependents = {}
+        for task_name, dependents in self.task_dependents.items():
+            streaming = [name for name in dependents if name in self._streaming_task_groups]
+            if streaming:
+                self._streaming_dependents[task_name] = streaming
+
+        # Kahn's algorithm, used only to detect cycles: nodes left with unresolved dependencies
+        # once nothing else can be peeled off are on or behind a cycle. Dependencies on unknown
+        # names never complete at run time but do not form a cycle, so they are ignored here
+        remaining = {
+            name: sum(1 for dep in deps if dep in self.task_dependencies)
+            for name, deps in self.task_dependencies.items()
+        }
+        queue = deque(name for name, count in remaining.items() if count == 0)
+        resolved = 0
+        while queue:
+            name = queue.popleft()
+            resolved += 1
+            for dependent in self.task_dependents.get(name, ()):
+                if dependent in remaining:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        queue.append(dependent)
+        self._cyclic_nodes = []
+        if resolved < len(remaining):
+            self._cyclic_nodes = sorted(name for name, count in remaining.items() if count > 0)
+
+    def find_dependency_cycle(self) -> List[str]:
+        """Return the sorted names of tasks and groups caught in a dependency cycle, or [] if none."""
+        self._ensure_dependency_graph()
+        return list(self._cyclic_nodes)
+
+    def _mark_completed(self, name: str, completed_tasks: Set[str], remaining: Dict[str, int], ready: Set[str]) -> None:
+        if name in completed_tasks:
+            return
+        completed_tasks.add(name)
+        ready.discard(name)
+        for dependent in self.task_dependents.get(name, ()):
+            if dependent in remaining:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.add(dependent)
 
     async def _execute_task(self, task_name: str, results: Dict[str, TaskResult]) -> TaskResult:
         task = self.tasks[task_name]
         task.dependency_outputs = {
             prev_task: results[prev_task].output
-            for prev_task in self.task_dependencies[task_name]
+            for prev_task in task.task_dependencies
         }
-        task.dependency_order = list(self.task_dependencies[task_name])
+        task.dependency_order = list(task.task_dependencies)
         
         # Check if this is a streaming task and enable streaming if needed
         if isinstance(task, StreamingTask) and self._has_streaming_dependents(task_name):
             task.enable_streaming()
         
-        result = await task.execute_with_timeout()
+        if self._task_semaphore is not None:
+            async with self._task_semaphore:
+                result = await task.execute_with_timeout()
+        else:
+            result = await task.execute_with_timeout()
         results[task_name] = result
         
         if not result.success:
@@ -226,29 +311,120 @@ class Workflow:
 
     def _has_streaming_dependents(self, task_name: str) -> bool:
         """Check if a task has streaming task groups as dependents."""
-        dependents = self.task_dependents.get(task_name, set())
-        return any(dep in self._streaming_task_groups for dep in dependents)
+        return task_name in self._streaming_dependents
+
+    async def _execute_group(self, group_name: str, results: Dict[str, TaskResult]) -> bool:
+        """Run a non-streaming task group over its parent's output; returns whether it completed."""
+        group = self.task_groups[group_name]
+        self.logger.info(f"Executing task group {group_name}")
+        
+        # Get parent task result
+        for_each_parts = group.config.path_parts
+        parent_task = for_each_parts[0]
+        
+        if parent_task not in results:
+            self.logger.error(f"Parent task {parent_task} not found for group {group_name}")
+            return False
+        
+        parent_result = results[parent_task]
+        if not parent_result.success:
+            self.logger.error(f"Parent task {parent_task} failed, skipping group {group_name}")
+            return False
+        
+        # Extract items from parent output; groups sharing a for_each path reuse the same walk
+        try:
+            cache_key = (parent_task, group.config.for_each)
+            items = self._extract_cache.get(cache_key)
+            if items is None:
+                items = self._extract_items_from_output(parent_result, group.config.for_each, for_each_parts[1:])
+                self._extract_cache[cache_key] = items
+            
+            group.create_tasks(self.registry, items)
+            group_result = await group.execute()
+            results[group_name] = group_result
+            # Dependents pick the group output up from results when _execute_task runs them
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to execute task group {group_name}: {e}")
+            results[group_name] = TaskResult(success=False, output={}, error=e)
+            return True
+
+    async def _run_regular_task(self, task_name: str, results: Dict[str, TaskResult], complete: Callable[[str], None]) -> bool:
+        """Run a task without streaming dependents; returns True if the workflow must stop."""
+        try:
+            result = await self._execute_task(task_name, results)
+        except Exception as e:
+            self.logger.error(f"Task {task_name} failed with error: {e}")
+            result = TaskResult(success=False, output={}, error=e)
+            results[task_name] = result
+        complete(task_name)
+        
+        if not result.success:
+            self.logger.error(f"Workflow stopped due to task {task_name} failure")
+            return True
+        return False
 
-    async def _handle_streaming_task_groups(self, task_name: str, task: Task) -> Dict[str, TaskResult]:
-        """Handle streaming task groups that depend on this task."""
-        streaming_results = {}
+    async def _run_streaming_task(self, task_name: str, task: Task, results: Dict[str, TaskResult], complete: Callable[[str], None]) -> bool:
+        """Run a streaming task together with the streaming groups it feeds; returns True if the workflow must stop."""
+        self.logger.info(f"Executing streaming task {task_name}")
         
-        for group_name in self.task_dependents.get(task_name, set()):
-            if group_name in self._streaming_task_groups:
-                streaming_group = self._streaming_task_groups[group_name]
-                
-                # Check if the for_each path matches this task
-                if streaming_group.config.for_each.startswith(task_name):
-                    self.logger.info(f"Starting streaming task group {group_name} for task {task_name}")
-                    
-                    if isinstance(task, StreamingTask) and task.yielder:
-                        # Execute streaming task group with the task's yielder
-                        result = await streaming_group.execute_streaming(task.yielder)
-                        streaming_results[group_name] = result
-                    else:
-                        self.logger.warning(f"Task {task_name} is not a streaming task but has streaming dependents")
+        # Enable streaming on the task first
+        if isinstance(task, StreamingTask):
+            task.enable_streaming()
         
-        return streaming_results
+        # Start streaming task groups concurrently with the streaming task
+        group_names = self._streaming_dependents.get(task_name, [])
+        streaming_group_tasks = []
+        for group_name in group_names:
+            self.logger.info(f"Starting concurrent streaming task group {group_name}")
+            streaming_group_tasks.append(
+                self._streaming_task_groups[group_name].execute_streaming(task.yielder)
+            )
+        
+        if not streaming_group_tasks:
+            # No streaming dependents, execute normally
+            result = await self._execute_task(task_name, results)
+            results[task_name] = result
+            complete(task_name)
+            
+            if not result.success:
+                self.logger.error(f"Workflow stopped due to streaming task {task_name} failure")
+                return True
+            return False
+        
+        # Run the streaming task and its streaming groups in parallel and wait for all of them
+        task_execution = self._execute_task(task_name, results)
+        concurrent_results = await asyncio.gather(task_execution, *streaming_group_tasks, return_exceptions=True)
+        
+        # Process task result
+        task_result = concurrent_results[0]
+        if isinstance(task_result, Exception):
+            self.logger.error(f"Streaming task {task_name} failed with error: {task_result}")
+            results[task_name] = TaskResult(success=False, output={}, error=task_result)
+            return True
+        
+        results[task_name] = task_result
+        complete(task_name)
+        
+        if not task_result.success:
+            self.logger.error(f"Workflow stopped due to streaming task {task_name} failure")
+            return True
+        
+        # Process streaming group results
+        for group_name, group_result in zip(group_names, concurrent_results[1:]):
+            if isinstance(group_result, Exception):
+                self.logger.error(f"Streaming group {group_name} failed with error: {group_result}")
+                results[group_name] = TaskResult(success=False, output={}, error=group_result)
+            else:
+                results[group_name] = group_result
+            complete(group_name)
+        return False
+
+    async def _run_group(self, group_name: str, results: Dict[str, TaskResult], complete: Callable[[str], None]) -> bool:
+        """Run a non-streaming task group; group failures never stop the workflow."""
+        if await self._execute_group(group_name, results):
+            complete(group_name)
+        return False
 
     async def run(self) -> Dict[str, TaskResult]:
         """
@@ -259,180 +435,78 @@ class Workflow:
             Dict[str, TaskResult]: A dictionary mapping task names to their execution results
 
         Note:
-            - Tasks are executed in topological order based on their dependencies
-            - If a task fails, the workflow stops and returns the results up to that point
+            - Each task or task group starts as soon as all of its dependencies have completed
+            - If a task fails, the workflow cancels running tasks and returns the results up to that point
             - Each task's output is made available to its dependent tasks
             - Streaming tasks can yield intermediate results to streaming task groups
+            - Raises ValueError if the dependencies contain a cycle; earlier versions silently
+              skipped the tasks on the cycle and ran the rest
         """
         results = {}
         completed_tasks = set()
-        self._build_dependency_graph()
-        
-        while True:
-            ready_tasks = self._get_ready_tasks(completed_tasks)
-            if not ready_tasks:
-                break
-                
-            tasks_to_execute = []
-            groups_to_execute = []
-            
-            for item_name in ready_tasks:
-                if item_name in self.tasks:
-                    tasks_to_execute.append(item_name)
-                elif item_name in self.task_groups:
-                    groups_to_execute.append(item_name)
-            
-            if not tasks_to_execute and not groups_to_execute:
-                break
-                
-            if tasks_to_execute:
-                self.logger.info(f"Executing {len(tasks_to_execute)} tasks concurrently: {tasks_to_execute}")
-            if groups_to_execute:
-                self.logger.info(f"Executing {len(groups_to_execute)} task groups: {groups_to_execute}")
-            
-            # Create tasks for execution with streaming support
-            execution_tasks = []
-            streaming_tasks = []
-            
-            for task_name in tasks_to_execute:
-                task = self.tasks[task_name]
-                
-                # Check if this task has streaming dependents
-                if self._has_streaming_dependents(task_name):
-                    streaming_tasks.append((task_name, task))
-                else:
-                    # Regular task execution
-                    execution_tasks.append(self._execute_task(task_name, results))
-            
-            # Execute regular tasks
-            if execution_tasks:
-                task_results = await asyncio.gather(*execution_tasks, return_exceptions=True)
-                
-                for task_name, result in zip([t for t in tasks_to_execute if not self._has_streaming_dependents(t)], task_results):
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Task {task_name} failed with error: {result}")
-                        results[task_name] = TaskResult(success=False, output={}, error=result)
-                    completed_tasks.add(task_name)
-                    
-                    if not results[task_name].success:
-                        self.logger.error(f"Workflow stopped due to task {task_name} failure")
-                        return results
-            
-            # Execute streaming tasks and their dependent groups
-            for task_name, task in streaming_tasks:
-                self.logger.info(f"Executing streaming task {task_name}")
-                
-                # Enable streaming on the task first
-                if isinstance(task, StreamingTask):
-                    task.enable_streaming()
-                
-                # Start streaming task groups concurrently with the streaming task
-                streaming_group_tasks = []
-                for group_name in self.task_dependents.get(task_name, set()):
-                    if group_name in self._streaming_task_groups:
-                        streaming_group = self._streaming_task_groups[group_name]
-                        if streaming_group.config.for_each.startswith(task_name):
-                            self.logger.info(f"Starting concurrent streaming task group {group_name}")
-                            streaming_group_tasks.append(
-                                streaming_group.execute_streaming(task.yielder)
-                            )
-                
-                # Execute the streaming task and streaming groups concurrently
-                if streaming_group_tasks:
-                    # Run task and streaming groups in parallel
-                    task_execution = self._execute_task(task_name, results)
-                    all_tasks = [task_execution] + streaming_group_tasks
-                    
-                    # Wait for all to complete
-                    concurrent_results = await asyncio.gather(*all_tasks, return_exceptions=True)
-                    
-                    # Process task result
-                    task_result = concurrent_results[0]
-                    if isinstance(task_result, Exception):
-                        self.logger.error(f"Streaming task {task_name} failed with error: {task_result}")
-                        results[task_name] = TaskResult(success=False, output={}, error=task_result)
-                        return results
-                    else:
-                        results[task_name] = task_result
-                        completed_tasks.add(task_name)
-                        
-                        if not task_result.success:
-                            self.logger.error(f"Workflow stopped due to streaming task {task_name} failure")
-                            return results
-                    
-                    # Process streaming group results
-                    group_names = [group_name for group_name in self.task_dependents.get(task_name, set()) 
-                                 if group_name in self._streaming_task_groups]
-                    
-                    for i, group_name in enumerate(group_names):
-                        group_result = concurrent_results[i + 1]  # +1 because task_result is at index 0
-                        if isinstance(group_result, Exception):
-                            self.logger.error(f"Streaming group {group_name} failed with error: {group_result}")
-                            results[group_name] = TaskResult(success=False, output={}, error=group_result)
+        self._ensure_dependency_graph()
+        if self._cyclic_nodes:
+            raise ValueError(f"Circular dependency detected between: {', '.join(self._cyclic_nodes)}")
+        self._task_semaphore = asyncio.Semaphore(self._max_concurrent) if self._max_concurrent else None
+        self._extract_cache = {}
+        remaining = dict(self._indegree)
+        ready = {name for name, count in remaining.items() if count == 0}
+        launched: Set[str] = set()
+        inflight: Dict[asyncio.Future, str] = {}
+        
+        def complete(name: str) -> None:
+            self._mark_completed(name, completed_tasks, remaining, ready)
+        
+        try:
+            while True:
+                # Launch every ready node right away instead of waiting for the rest of a wave
+                started_tasks = []
+                started_groups = []
+                for item_name in [name for name in ready if name not in launched]:
+                    task = self.tasks.get(item_name)
+                    if task is not None:
+                        if item_name in self._streaming_dependents:
+                            runner = self._run_streaming_task(item_name, task, results, complete)
                         else:
-                            results[group_name] = group_result
-                        completed_tasks.add(group_name)
-                else:
-                    # No streaming dependents, execute normally
-                    result = await self._execute_task(task_name, results)
-                    results[task_name] = result
-                    completed_tasks.add(task_name)
-                    
-                    if not result.success:
-                        self.logger.error(f"Workflow stopped due to streaming task {task_name} failure")
-                        return results
-            
-            # Execute ready task groups
-            for group_name in groups_to_execute:
-                if group_name in self._streaming_task_groups:
-                    # Streaming groups are handled by their parent tasks
-                    continue
-                    
-                group = self.task_groups[group_name]
-                self.logger.info(f"Executing task group {group_name}")
+                            runner = self._run_regular_task(item_name, results, complete)
+                        started_tasks.append(item_name)
+                    elif item_name in self.task_groups and item_name not in self._streaming_task_groups:
+                        # Streaming groups are started by their parent tasks
+                        runner = self._run_group(item_name, results, complete)
+                        started_groups.append(item_name)
+                    else:
+                        continue
+                    launched.add(item_name)
+                    inflight[asyncio.ensure_future(runner)] = item_name
                 
-                # Get parent task result
-                for_each_parts = group.config.for_each.split('.')
-                parent_task = for_each_parts[0]
+                if not inflight:
+                    break
                 
-                if parent_task not in results:
-                    self.logger.error(f"Parent task {parent_task} not found for group {group_name}")
-                    continue
+                if self.logger.isEnabledFor(logging.INFO):
+                    if started_tasks:
+                        self.logger.info(f"Executing {len(started_tasks)} tasks concurrently: {started_tasks}")
+                    if started_groups:
+                        self.logger.info(f"Executing {len(started_groups)} task groups: {started_groups}")
                 
-                parent_result = results[parent_task]
-                if not parent_result.success:
-                    self.logger.error(f"Parent task {parent_task} failed, skipping group {group_name}")
-                    continue
+                done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                stop = False
+                for future in done:
+                    item_name = inflight.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        self.logger.error(f"Task {item_name} failed with error: {error}")
+                        results[item_name] = TaskResult(success=False, output={}, error=error)
+                        stop = True
+                    elif future.result():
+                        stop = True
                 
-                # Extract items from parent output
-                try:
-                    current = parent_result.output
-                    for part in for_each_parts[1:]:
-                        if isinstance(current, dict) and part in current:
-                            current = current[part]
-                        else:
-                            raise ValueError(f"Path {group.config.for_each} not found in task output")
-                    
-                    if not isinstance(current, list):
-                        raise ValueError(f"Expected list at path {group.config.for_each}, got {type(current)}")
-                    
-                    group.create_tasks(self.registry, current)
-                    group_result = await group.execute()
-                    results[group_name] = group_result
-                    completed_tasks.add(group_name)
-                    
-                    # Update dependents
-                    for next_task_name in self.task_dependents.get(group_name, set()):
-                        if next_task_name in self.tasks:
-                            next_task = self.tasks[next_task_name]
-                            next_task.dependency_outputs[group_name] = group_result.output
-                            if group_name not in next_task.dependency_order:
-                                next_task.dependency_order.append(group_name)
-                                
-                except Exception as e:
-                    self.logger.error(f"Failed to execute task group {group_name}: {e}")
-                    results[group_name] = TaskResult(success=False, output={}, error=e)
-                    completed_tasks.add(group_name)
+                if stop:
+                    return results
+        finally:
+            if inflight:
+                for future in inflight:
+                    future.cancel()
+                await asyncio.gather(*inflight, return_exceptions=True)
         
         return results
 
@@ -499,6 +573,16 @@ class Workflow:
         """
         return self._workflow_progress.copy()
 
+    def set_max_concurrent(self, max_concurrent: Optional[int]) -> None:
+        """Limit how many tasks the workflow executes at the same time.
+        
+        Args:
+            max_concurrent: Maximum number of concurrently running tasks, or None for no limit
+        """
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be a positive integer")
+        self._max_concurrent = max_concurrent
+
     def set_progress_enabled(self, enabled: bool) -> None:
         """Enable or disable progress tracking for the workflow.
         
@@ -507,8 +591,10 @@ class Workflow:
         """
         self._progress_enabled = enabled
         
+        observer = self._on_task_progress if enabled else None
         for task in self.tasks.values():
             task.set_progress_enabled(enabled)
+            task.set_progress_observer(observer)
 
     def _on_task_progress(self, task_name: str, progress: TaskProgress) -> None:
         """Internal callback for when a task's progress is updated.
@@ -517,9 +603,18 @@ class Workflow:
             task_name: Name of the task that updated its progress
             progress: The new progress information
         """
+        previous = self._workflow_progress.get(task_name)
         self._workflow_progress[task_name] = progress
         
-        for callback in self._progress_callbacks:
+        was_complete = previous is not None and previous.percentage >= 100
+        is_complete = progress.percentage >= 100
+        if is_complete != was_complete:
+            self._completed_progress_count += 1 if is_complete else -1
+        
+        callbacks = self._progress_callbacks
+        if not callbacks:
+            return
+        for callback in callbacks:
             try:
                 callback(task_name, progress)
             except Exception as e:
@@ -535,8 +630,7 @@ class Workflow:
             return TaskProgress(current=0, total=100, message="No tasks started")
         
         total_tasks = len(self.tasks)
-        completed_tasks = sum(1 for progress in self._workflow_progress.values() 
-                            if progress.percentage >= 100)
+        completed_tasks = self._completed_progress_count
         
         overall_percentage = (completed_tasks / total_tasks) * 100 if total_tasks > 0 else 0
         
@@ -1,11 +1,22 @@
-from typing import Dict, Any, List, Optional, AsyncIterator
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple, Callable, Awaitable
+from dataclasses import dataclass, field
 import logging
+import json
 import asyncio
 from ..core.task import Task
 from ..core.registry import TaskRegistry
 from ..models.task_result import TaskResult, StreamingTaskResult, StreamingYielder
 
+_MISSING = object()
+
+class _TaskGroupFailure(Exception):
+    """Raised inside a fail_fast group to stop the remaining tasks."""
+
+    def __init__(self, task_name: str, error: Any):
+        super().__init__(task_name)
+        self.task_name = task_name
+        self.error = error
+
 @dataclass
 class TaskGroupConfig:
     type: str
@@ -14,6 +25,11 @@ class TaskGroupConfig:
     max_concurrent: int = 10
     error_handling: Optional[str] = None
     streaming_enabled: bool = False
+    deduplicate: bool = False
+    path_parts: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.path_parts = tuple(self.for_each.split('.')) if isinstance(self.for_each, str) else ()
 
 class TaskGroup:
     def __init__(self, name: str, config: TaskGroupConfig):
@@ -22,63 +38,110 @@ class TaskGroup:
         self.tasks: List[Task] = []
         self.output: List[Any] = []
         self.logger = logging.getLogger(f"task_group.{name}")
+        self._compile_config_template()
+
+    def _compile_config_template(self) -> None:
+        # Sort template values once so per-item config building only touches the dynamic ones
+        self._static_config: Dict[str, Any] = {}
+        self._item_keys: List[str] = []
+        self._path_keys: List[Tuple[str, str, Tuple[str, ...]]] = []
+        for key, value in self.config.config_template.items():
+            if isinstance(value, str) and value.startswith("$"):
+                if value == "${item}":
+                    self._item_keys.append(key)
+                    continue
+                path = value[1:]
+                if path.startswith("."):
+                    path = path[1:]
+                self._path_keys.append((key, path, tuple(path.split("."))))
+            else:
+                self._static_config[key] = value
 
     def create_tasks(self, registry: TaskRegistry, parent_output: Any) -> None:
         if not isinstance(parent_output, list):
             raise ValueError(f"Parent output must be a list for task group {self.name}")
 
         self.logger.info(f"Creating tasks for {len(parent_output)} items")
-        for item in parent_output:
-            config = self._create_task_config(item)
-            task = registry.create_task(self.config.type, f"{self.name}_{len(self.tasks)}", config)
-            self.tasks.append(task)
-            self.logger.info(f"Created task {task.name}")
+        append = self.tasks.append
+        create_task = registry.create_task
+        create_config = self._create_task_config
+        task_type = self.config.type
+        prefix = f"{self.name}_"
+        log_each = self.logger.isEnabledFor(logging.INFO)
+        for index, item in enumerate(parent_output, len(self.tasks)):
+            task = create_task(task_type, f"{prefix}{index}", create_config(item))
+            append(task)
+            if log_each:
+                self.logger.info(f"Created task {task.name}")
 
     def _create_task_config(self, item: Any) -> Dict[str, Any]:
-        config = {}
-        for key, value in self.config.config_template.items():
-            if isinstance(value, str):
-                if value == "${item}":
-                    config[key] = item
-                elif value.startswith("$"):
-                    path = value[1:]
-                    if path.startswith("."):
-                        path = path[1:]
-                    config[key] = self._get_value_from_path(item, path)
-                else:
-                    config[key] = value
-            else:
-                config[key] = value
+        config = self._static_config.copy()
+        for key in self._item_keys:
+            config[key] = item
+        for key, path, parts in self._path_keys:
+            config[key] = self._get_value_from_path(item, path, parts)
         return config
 
-    def _get_value_from_path(self, item: Any, path: str) -> Any:
-        parts = path.split(".")
+    def _get_value_from_path(self, item: Any, path: str, parts: Optional[Tuple[str, ...]] = None) -> Any:
+        if parts is None:
+            parts = path.split(".")
         current = item
         for part in parts:
             if isinstance(current, dict):
                 current = current.get(part)
-            elif hasattr(current, part):
-                current = getattr(current, part)
-            else:
+                continue
+            # One attribute lookup instead of hasattr followed by getattr
+            current = getattr(current, part, _MISSING)
+            if current is _MISSING:
                 raise ValueError(f"Invalid path {path} in task group {self.name}")
         return current
 
     async def execute(self) -> TaskResult:
         self.logger.info(f"Executing {len(self.tasks)} tasks")
         results = []
+        fail_fast = self.config.error_handling == "fail_fast"
+        tasks = self.tasks
+        duplicates: Dict[str, List[Task]] = {}
+        if self.config.deduplicate:
+            tasks, duplicates = self._collapse_duplicates()
+        log_each = self.logger.isEnabledFor(logging.INFO)
         
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
-        
-        async def execute_task(task: Task) -> None:
-            async with semaphore:
+        async def run_task(task: Task) -> None:
+            if log_each:
                 self.logger.info(f"Executing task {task.name}")
-                result = await task.execute_with_timeout()
-                if result.success:
+            result = await task.execute_with_timeout()
+            copies = duplicates.get(task.name, ())
+            for duplicate in copies:
+                duplicate.status = task.status
+                duplicate.result = result
+            if result.success:
+                results.append(result.output)
+                for _ in copies:
                     results.append(result.output)
-                else:
-                    self.logger.error(f"Task {task.name} failed: {result.error}")
+            else:
+                self.logger.error(f"Task {task.name} failed: {result.error}")
+                if fail_fast:
+                    raise _TaskGroupFailure(task.name, result.error)
+        
+        runners = self._make_runners(run_task, tasks)
         
-        await asyncio.gather(*(execute_task(task) for task in self.tasks))
+        if not fail_fast:
+            await asyncio.gather(*runners)
+        else:
+            pending = [asyncio.ensure_future(runner) for runner in runners]
+            try:
+                await asyncio.gather(*pending)
+            except _TaskGroupFailure as failure:
+                self.logger.error(f"Cancelling remaining tasks after {failure.task_name} failed")
+                for future in pending:
+                    future.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                self.output = results
+                return TaskResult(
+                    success=False,
+                    output={"results": results},
+                    error=failure.error
+                )
         
         self.output = results
         return TaskResult(
@@ -86,6 +149,42 @@ class TaskGroup:
             output={"results": results}
         )
 
+    def _collapse_duplicates(self) -> Tuple[List[Task], Dict[str, List[Task]]]:
+        """Pick one task per distinct rendered config; the rest reuse its result."""
+        leaders: List[Task] = []
+        leader_by_key: Dict[str, Task] = {}
+        duplicates: Dict[str, List[Task]] = {}
+        for task in self.tasks:
+            try:
+                key = json.dumps(task.config, sort_keys=True)
+            except (TypeError, ValueError):
+                leaders.append(task)
+                continue
+            leader = leader_by_key.get(key)
+            if leader is None:
+                leader_by_key[key] = task
+                leaders.append(task)
+            else:
+                duplicates.setdefault(leader.name, []).append(task)
+        if duplicates:
+            self.logger.info(f"Collapsed {len(self.tasks) - len(leaders)} duplicate tasks")
+        return leaders, duplicates
+
+    def _make_runners(self, run_task: Callable[[Task], Awaitable[None]], tasks: List[Task]) -> List[Awaitable[None]]:
+        # Within the limit every task runs at once; above it, a fixed pool of workers pulls
+        # from a shared iterator so only max_concurrent coroutines exist at a time
+        limit = self.config.max_concurrent
+        if not 0 < limit < len(tasks):
+            return [run_task(task) for task in tasks]
+        
+        remaining = iter(tasks)
+        
+        async def worker() -> None:
+            for task in remaining:
+                await run_task(task)
+        
+        return [worker() for _ in range(limit)]
+
     def get_output(self) -> List[Any]:
         return self.output
 
@@ -99,8 +198,10 @@ class StreamingTaskGroup(TaskGroup):
         super().__init__(name, config)
         self._active_tasks: Dict[str, Task] = {}
         self._completed_results: List[Any] = []
-        self._result_lock = asyncio.Lock()
         self.registry: Optional[TaskRegistry] = None
+        # Streamed outputs are already scoped to the parent task, so skip its name
+        path_parts = config.path_parts
+        self._item_path = path_parts[1:] if len(path_parts) > 1 else path_parts
         
     async def execute_streaming(self, stream_yielder: StreamingYielder) -> TaskResult:
         """Execute the task group in streaming mode, processing data as it arrives."""
@@ -114,61 +215,84 @@ class StreamingTaskGroup(TaskGroup):
             )
         
         results = []
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        log_each = self.logger.isEnabledFor(logging.INFO)
+        # A fixed pool of workers drains a bounded queue, so a fast stream is held
+        # back instead of piling up one pending task per item
+        limit = max(self.config.max_concurrent, 1)
+        work_queue: asyncio.Queue = asyncio.Queue(maxsize=limit * 2)
         
         async def process_streaming_item(item_data: Any, item_index: int) -> None:
             """Process a single streamed item by creating and executing a task."""
             task_name = f"{self.name}_streaming_{item_index}"
-            config = self._create_task_config(item_data)
             
             try:
+                config = self._create_task_config(item_data)
                 task = self.registry.create_task(self.config.type, task_name, config)
                 self._active_tasks[task_name] = task
                 
-                async with semaphore:
-                    self.logger.info(f"Executing streaming task {task_name}")
+                try:
+                    if log_each:
+                        self.logger.info(f"Executing streaming task {task_name}")
                     result = await task.execute_with_timeout()
-                    
-                    async with self._result_lock:
-                        if result.success:
-                            results.append(result.output)
-                            self._completed_results.append(result.output)
-                            self.logger.info(f"Streaming task {task_name} completed successfully")
-                        else:
-                            self.logger.error(f"Streaming task {task_name} failed: {result.error}")
-                    
+                finally:
                     del self._active_tasks[task_name]
+                
+                # Nothing awaits between the result and these appends, so no lock is needed
+                if result.success:
+                    results.append(result.output)
+                    self._completed_results.append(result.output)
+                    if log_each:
+                        self.logger.info(f"Streaming task {task_name} completed successfully")
+                else:
+                    self.logger.error(f"Streaming task {task_name} failed: {result.error}")
                     
             except Exception as e:
                 self.logger.error(f"Failed to create/execute streaming task for item {item_data}: {e}")
         
+        async def worker() -> None:
+            while True:
+                entry = await work_queue.get()
+                if entry is None:
+                    return
+                await process_streaming_item(*entry)
+        
+        workers = [asyncio.ensure_future(worker()) for _ in range(limit)]
+        
         # Process streaming results
-        tasks_created = []
         item_count = 0
         
-        async for stream_result in stream_yielder:
-            if isinstance(stream_result, StreamingTaskResult) and stream_result.success:
-                # Extract items from the streamed output
-                try:
-                    items = self._extract_streaming_items(stream_result.output)
-                    self.logger.info(f"Extracted {len(items)} items from streaming result")
+        try:
+            async for stream_result in stream_yielder:
+                if isinstance(stream_result, StreamingTaskResult) and stream_result.success:
+                    # Extract items from the streamed output
+                    try:
+                        items = self._extract_streaming_items(stream_result.output)
+                    except Exception as e:
+                        self.logger.error(f"Failed to extract items from streaming result: {e}")
+                        items = []
+                    else:
+                        if log_each:
+                            self.logger.info(f"Extracted {len(items)} items from streaming result")
                     
                     for item in items:
-                        task = asyncio.create_task(process_streaming_item(item, item_count))
-                        tasks_created.append(task)
+                        await work_queue.put((item, item_count))
                         item_count += 1
                         
-                except Exception as e:
-                    self.logger.error(f"Failed to extract items from streaming result: {e}")
-                    
-            if stream_result.stream_complete:
-                self.logger.info("Streaming completed, waiting for all tasks to finish")
-                break
-        
-        # Wait for all streaming tasks to complete
-        if tasks_created:
-            self.logger.info(f"Waiting for {len(tasks_created)} streaming tasks to complete")
-            await asyncio.gather(*tasks_created, return_exceptions=True)
+                if stream_result.stream_complete:
+                    self.logger.info("Streaming completed, waiting for all tasks to finish")
+                    break
+            
+            # Wait for all streaming tasks to complete
+            if item_count:
+                self.logger.info(f"Waiting for {item_count} streaming tasks to complete")
+            for _ in workers:
+                await work_queue.put(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+        except BaseException:
+            for future in workers:
+                future.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
         
         self.output = results
         self.logger.info(f"Streaming task group {self.name} completed with {len(results)} results")
@@ -183,18 +307,10 @@ class StreamingTaskGroup(TaskGroup):
         if not isinstance(output_data, dict):
             return []
             
-        # Parse the for_each path to extract items
-        path_parts = self.config.for_each.split('.')
         current = output_data
-        
-        # Skip the first part if it's a task name (we're already in the right context)
-        if len(path_parts) > 1:
-            path_parts = path_parts[1:]
-        
-        for part in path_parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
+        for part in self._item_path:
+            current = current.get(part, _MISSING) if isinstance(current, dict) else _MISSING
+            if current is _MISSING:
                 self.logger.debug(f"Path part '{part}' not found in streaming data")
                 return []
         
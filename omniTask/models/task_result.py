@@ -1,8 +1,22 @@
 from dataclasses import dataclass
-from typing import Any, Optional, Dict, AsyncIterator, Callable
+from typing import Any, Optional, Dict, List, AsyncIterator, Callable, Tuple
 import asyncio
+import sys
 
-@dataclass
+# Results are created for every task run and every streamed item, so drop the per-instance
+# __dict__ where dataclasses support it
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+def _restore_state(self, state: Any) -> None:
+    # Cached results may have been pickled before these classes had slots, in which case
+    # the state is a plain __dict__ rather than a (dict, slots) pair
+    if isinstance(state, tuple):
+        instance_dict, slot_state = state
+        state = {**(instance_dict or {}), **(slot_state or {})}
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+@dataclass(**_SLOTS)
 class TaskProgress:
     current: int = 0
     total: int = 100
@@ -13,7 +27,9 @@ class TaskProgress:
         if self.total > 0:
             self.percentage = (self.current / self.total) * 100
 
-@dataclass
+    __setstate__ = _restore_state
+
+@dataclass(**_SLOTS)
 class TaskResult:
     success: bool
     output: Dict[str, Any]
@@ -22,17 +38,51 @@ class TaskResult:
     retries: Optional[int] = None
     progress: Optional[TaskProgress] = None
 
-@dataclass 
+    __setstate__ = _restore_state
+
+@dataclass(**_SLOTS)
 class StreamingTaskResult(TaskResult):
     stream_complete: bool = False
     is_streaming: bool = True
 
 class StreamingYielder:
-    def __init__(self):
-        self._queue = asyncio.Queue()
+    """Single-producer channel between a streaming task and its consumers.
+
+    Results are kept in a ring buffer. The producer wakes consumers with one
+    event per batch instead of a queue operation per item, and a consumer
+    drains everything available after each wakeup. When the buffer is full,
+    yield_result waits for an active iterator to make room; with no iterator
+    attached (e.g. listener-only use) the buffer grows instead.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self._buffer: List[Optional[StreamingTaskResult]] = [None] * size
+        self._mask = size - 1
+        self._head = 0
+        self._tail = 0
+        self._data_ready = asyncio.Event()
+        self._space_ready = asyncio.Event()
         self._complete = False
-        self._listeners = []
-        
+        self._consumers = 0
+        self._listeners: List[Tuple[bool, Callable[[StreamingTaskResult], Any]]] = []
+
+    def _grow(self) -> None:
+        old_buffer, old_mask = self._buffer, self._mask
+        size = len(old_buffer) * 2
+        buffer: List[Optional[StreamingTaskResult]] = [None] * size
+        mask = size - 1
+        for index in range(self._tail, self._head):
+            buffer[index & mask] = old_buffer[index & old_mask]
+        self._buffer, self._mask = buffer, mask
+
+    def _push(self, result: StreamingTaskResult) -> None:
+        self._buffer[self._head & self._mask] = result
+        self._head += 1
+        self._data_ready.set()
+
     async def yield_result(self, data: Any) -> None:
         if self._complete:
             return
@@ -43,10 +93,17 @@ class StreamingYielder:
             stream_complete=False
         )
         
-        await self._queue.put(stream_result)
+        while self._head - self._tail > self._mask:
+            if not self._consumers:
+                # Nobody is draining the buffer, so waiting would never end
+                self._grow()
+                break
+            self._space_ready.clear()
+            await self._space_ready.wait()
+        self._push(stream_result)
         
-        for listener in self._listeners:
-            asyncio.create_task(listener(stream_result))
+        if self._listeners:
+            self._notify(stream_result)
     
     async def complete(self, final_result: TaskResult) -> None:
         if self._complete:
@@ -66,20 +123,48 @@ class StreamingYielder:
                 stream_complete=True
             )
         
-        await self._queue.put(final_result)
+        # Never block on the final result: a producer that is finishing must
+        # not hang on a consumer that has gone away.
+        if self._head - self._tail > self._mask:
+            self._grow()
+        self._push(final_result)
         
-        for listener in self._listeners:
-            asyncio.create_task(listener(final_result))
+        if self._listeners:
+            self._notify(final_result)
+    
+    def _notify(self, result: StreamingTaskResult) -> None:
+        # Plain callables run inline; only coroutine listeners need a task of their own
+        for is_coroutine, listener in self._listeners:
+            if is_coroutine:
+                asyncio.create_task(listener(result))
+            else:
+                listener(result)
     
-    def add_listener(self, listener: Callable[[StreamingTaskResult], None]) -> None:
-        self._listeners.append(listener)
+    def add_listener(self, listener: Callable[[StreamingTaskResult], Any]) -> None:
+        self._listeners.append((asyncio.iscoroutinefunction(listener), listener))
     
     async def __aiter__(self) -> AsyncIterator[StreamingTaskResult]:
-        while True:
-            result = await self._queue.get()
-            yield result
-            if result.stream_complete:
-                break
+        self._consumers += 1
+        try:
+            while True:
+                while self._tail == self._head:
+                    self._data_ready.clear()
+                    await self._data_ready.wait()
+                
+                head = self._head
+                while self._tail < head:
+                    index = self._tail & self._mask
+                    result = self._buffer[index]
+                    self._buffer[index] = None
+                    self._tail += 1
+                    self._space_ready.set()
+                    yield result
+                    if result.stream_complete:
+                        return
+        finally:
+            self._consumers -= 1
+            # Wake a blocked producer so it can grow the buffer if we were the last consumer
+            self._space_ready.set()
     
     @property
     def is_complete(self) -> bool:
@@ -1,4 +1,19 @@
 import logging
+from datetime import datetime
+
+class TaskTimestampFilter(logging.Filter):
+    """Stamps task log records with an ISO timestamp derived from record.created.
+
+    Logger filters only run for records that passed the level check, so the
+    timestamp is never formatted for discarded messages. They also only run
+    on the logger they are attached to, not for records from child loggers;
+    TaskLogFormatter derives the timestamp itself when it is missing.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, 'timestamp'):
+            record.timestamp = datetime.fromtimestamp(record.created).isoformat()
+        return True
 
 class TaskLogFormatter(logging.Formatter):
     def format(self, record):
@@ -14,11 +29,26 @@ class TaskLogFormatter(logging.Formatter):
             
         if hasattr(record, 'timestamp'):
             record.time_info = f"[{record.timestamp}]"
+        elif hasattr(record, 'task_name'):
+            record.timestamp = datetime.fromtimestamp(record.created).isoformat()
+            record.time_info = f"[{record.timestamp}]"
         else:
             record.time_info = ""
             
         return super().format(record)
 
+class TaskLoggerAdapter(logging.LoggerAdapter):
+    """Adds a task's identity to every record logged through it.
+
+    Unlike the stock adapter, per-call ``extra`` fields are merged with the
+    adapter's own instead of replacing them.
+    """
+
+    def process(self, msg, kwargs):
+        extra = kwargs.get('extra')
+        kwargs['extra'] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
 def setup_task_logging(level=logging.INFO):
     logging.basicConfig(level=level)
     formatter = TaskLogFormatter(
@@ -5,22 +5,31 @@ class PathParser:
     RELATIVE_PATH_PATTERN = re.compile(r'^prev(\d*)(?:\.(.*))?$')
     ARRAY_ACCESS_PATTERN = re.compile(r'^([^[]*)(?:\[(\d+)\])?$')
 
+    # The patterns above document the grammar; the parsers below implement it with
+    # plain string operations, which are cheaper than a regex match per path
+
     @staticmethod
     def parse_relative_path(path: str) -> Tuple[Optional[int], Optional[str]]:
-        match = PathParser.RELATIVE_PATH_PATTERN.match(path)
-        if not match:
+        if not path.startswith('prev'):
+            return None, None
+        
+        dot_index = path.find('.', 4)
+        digits = path[4:] if dot_index == -1 else path[4:dot_index]
+        if digits and not digits.isdecimal():
             return None, None
         
-        steps_back = int(match.group(1)) if match.group(1) else 1
-        remaining_path = match.group(2) or ""
+        steps_back = int(digits) if digits else 1
+        remaining_path = path[dot_index + 1:] if dot_index != -1 else ""
         return steps_back, remaining_path
 
     @staticmethod
     def parse_array_access(part: str) -> Tuple[Optional[str], Optional[int]]:
-        match = PathParser.ARRAY_ACCESS_PATTERN.match(part)
-        if not match:
+        bracket_index = part.find('[')
+        if bracket_index == -1:
+            return part or None, None
+        
+        digits = part[bracket_index + 1:-1]
+        if not (part.endswith(']') and digits and digits.isdecimal()):
             return None, None
         
-        key = match.group(1) or None
-        index = int(match.group(2)) if match.group(2) else None
-        return key, index 
\ No newline at end of file
+        return part[:bracket_index] or None, int(digits) 
\ No newline at end of file
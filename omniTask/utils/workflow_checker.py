@@ -1,4 +1,4 @@
-from typing import Dict, Set, List, Optional, Any, Tuple
+from typing import Dict, Set, List, Optional, Any, Tuple, FrozenSet
 from ..core.workflow import Workflow
 from ..core.task import Task, StreamingTask
 from ..models.task_group import TaskGroupConfig, StreamingTaskGroup
@@ -7,98 +7,170 @@ import re
 import inspect
 import ast
 import textwrap
+import functools
 from difflib import get_close_matches
+from weakref import WeakKeyDictionary
+
+_INTERP_RE = re.compile(r'\${([^}]+)}')
+_VALID_OPS_LIST = ('eq', 'ne', 'gt', 'lt', 'gte', 'lte', 'in', 'not_in')
+_VALID_OPS = frozenset(_VALID_OPS_LIST)
+_NO_KEYS: FrozenSet[str] = frozenset()
+_STREAMING_INDICATORS = frozenset({'streaming_complete', 'total_found', 'progress', 'items', 'results'})
+
+@functools.lru_cache(maxsize=128)
+def _operator_suggestions(operator: str) -> Tuple[str, ...]:
+    return tuple(get_close_matches(operator, _VALID_OPS_LIST, n=3, cutoff=0.6))
+
+# Parsed source of each analysed method, keyed by its function object
+_SOURCE_TREE_CACHE: "WeakKeyDictionary[Any, ast.Module]" = WeakKeyDictionary()
+# Output keys found by AST analysis, per task class and method name
+_OUTPUT_KEYS_CACHE: "WeakKeyDictionary[type, Dict[str, FrozenSet[str]]]" = WeakKeyDictionary()
+# (successful TaskResult output keys, constant get_output() paths) of each scanned method
+_METHOD_SCAN_CACHE: "WeakKeyDictionary[Any, Tuple[Tuple[Any, ...], Tuple[Any, ...]]]" = WeakKeyDictionary()
+# Facts about the execute_streaming() source of each streaming task class
+_STREAMING_SOURCE_CACHE: "WeakKeyDictionary[type, Dict[str, bool]]" = WeakKeyDictionary()
+
+def _source_tree(method: Any, source: Optional[str] = None) -> ast.Module:
+    func = getattr(method, '__func__', method)
+    tree = _SOURCE_TREE_CACHE.get(func)
+    if tree is None:
+        if source is None:
+            source = inspect.getsource(func)
+        tree = _SOURCE_TREE_CACHE[func] = ast.parse(textwrap.dedent(source))
+    return tree
+
+def _scan_method(method: Any) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+    func = getattr(method, '__func__', method)
+    scan = _METHOD_SCAN_CACHE.get(func)
+    if scan is not None:
+        return scan
+
+    # Only calls spelled TaskResult(...) and .get_output(...) are recognised, so a method
+    # that mentions neither has nothing to find and need not be parsed
+    source = inspect.getsource(func)
+    if 'TaskResult' not in source and 'get_output' not in source:
+        scan = _METHOD_SCAN_CACHE[func] = ((), ())
+        return scan
+
+    # One walk collects everything; TaskResult outputs are resolved afterwards because a
+    # dict they refer to may be assigned in a node the walk reaches later
+    dict_assignments = {}
+    outputs = []
+    paths = []
+
+    for node in ast.walk(_source_tree(func, source)):
+        if isinstance(node, ast.Assign):
+            if (len(node.targets) == 1 and 
+                isinstance(node.targets[0], ast.Name) and 
+                isinstance(node.value, ast.Dict)):
+                var_name = node.targets[0].id
+                dict_keys = []
+                for key in node.value.keys:
+                    if isinstance(key, ast.Constant):
+                        dict_keys.append(key.value)
+                dict_assignments[var_name] = dict_keys
+            
+            elif (len(node.targets) == 1 and 
+                  isinstance(node.targets[0], ast.Subscript) and
+                  isinstance(node.targets[0].value, ast.Name) and
+                  isinstance(node.targets[0].slice, ast.Constant)):
+                var_name = node.targets[0].value.id
+                key = node.targets[0].slice.value
+                if var_name not in dict_assignments:
+                    dict_assignments[var_name] = []
+                if key not in dict_assignments[var_name]:
+                    dict_assignments[var_name].append(key)
+
+        elif isinstance(node, ast.Call):
+            call = node.func
+            if (isinstance(call, ast.Name) and call.id == 'TaskResult') or \
+               (isinstance(call, ast.Attribute) and call.attr == 'TaskResult'):
+
+                success_value = None
+                output_value = None
+                for kw in node.keywords:
+                    if kw.arg == 'success':
+                        if isinstance(kw.value, ast.Constant):
+                            success_value = kw.value.value
+                    elif kw.arg == 'output':
+                        output_value = kw.value
+
+                if success_value is True:
+                    outputs.append(output_value)
+
+            elif isinstance(call, ast.Attribute) and call.attr == 'get_output':
+                if node.args and isinstance(node.args[0], ast.Constant):
+                    paths.append(node.args[0].value)
+
+    keys = []
+    for output_value in outputs:
+        # Handle direct dictionary literals
+        if isinstance(output_value, ast.Dict):
+            for key in output_value.keys:
+                if isinstance(key, ast.Constant):
+                    keys.append(key.value)
+        # Handle variable references
+        elif isinstance(output_value, ast.Name):
+            var_name = output_value.id
+            if var_name in dict_assignments:
+                keys.extend(dict_assignments[var_name])
+
+    scan = _METHOD_SCAN_CACHE[func] = (tuple(keys), tuple(paths))
+    return scan
 
 class WorkflowChecker:
     def __init__(self, workflow: Workflow):
         self.workflow = workflow
+        # get_all_tasks() builds a new list on every call; take one snapshot for the checker's lifetime
+        self._all_tasks: List[Task] = workflow.get_all_tasks()
         self.task_output_keys: Dict[str, Set[str]] = {}
         self.task_dependencies: Dict[str, List[str]] = {}
+        self._dependency_sets: Dict[str, FrozenSet[str]] = {}
         self.task_group_configs: Dict[str, Dict[str, Any]] = {}
         self.streaming_tasks: Set[str] = set()
+        self._streaming_task_list: List[StreamingTask] = []
         self.streaming_task_groups: Set[str] = set()
+        self._streaming_group_refs: Dict[str, List[str]] = {}
+        self._path_cache: Dict[Tuple[str, str], Tuple[bool, Tuple[str, ...]]] = {}
+        self._similar_cache: Dict[Tuple[str, str, float], Tuple[str, ...]] = {}
+        self._group_path_cache: Dict[Tuple[str, str], Tuple[bool, Tuple[str, ...]]] = {}
         self._analyze_tasks()
         self._analyze_task_groups()
         self._analyze_streaming_components()
 
     @staticmethod
     def analyze_successful_taskresult_output_keys(cls, method_name='execute'):
-        method = getattr(cls, method_name)
-        source = inspect.getsource(method).lstrip()
-        tree = ast.parse(source)
-
-        keys = []
-        dict_assignments = {}
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                if (len(node.targets) == 1 and 
-                    isinstance(node.targets[0], ast.Name) and 
-                    isinstance(node.value, ast.Dict)):
-                    var_name = node.targets[0].id
-                    dict_keys = []
-                    for key in node.value.keys:
-                        if isinstance(key, ast.Constant):
-                            dict_keys.append(key.value)
-                    dict_assignments[var_name] = dict_keys
-                
-                elif (len(node.targets) == 1 and 
-                      isinstance(node.targets[0], ast.Subscript) and
-                      isinstance(node.targets[0].value, ast.Name) and
-                      isinstance(node.targets[0].slice, ast.Constant)):
-                    var_name = node.targets[0].value.id
-                    key = node.targets[0].slice.value
-                    if var_name not in dict_assignments:
-                        dict_assignments[var_name] = []
-                    if key not in dict_assignments[var_name]:
-                        dict_assignments[var_name].append(key)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func = node.func
-                if (isinstance(func, ast.Name) and func.id == 'TaskResult') or \
-                   (isinstance(func, ast.Attribute) and func.attr == 'TaskResult'):
-
-                    success_value = None
-                    output_value = None
-                    for kw in node.keywords:
-                        if kw.arg == 'success':
-                            if isinstance(kw.value, ast.Constant):
-                                success_value = kw.value.value
-                        elif kw.arg == 'output':
-                            output_value = kw.value
-
-                    if success_value is True:
-                        # Handle direct dictionary literals
-                        if isinstance(output_value, ast.Dict):
-                            for key in output_value.keys:
-                                if isinstance(key, ast.Constant):
-                                    keys.append(key.value)
-                        # Handle variable references
-                        elif isinstance(output_value, ast.Name):
-                            var_name = output_value.id
-                            if var_name in dict_assignments:
-                                keys.extend(dict_assignments[var_name])
-
+        return list(_scan_method(getattr(cls, method_name))[0])
+
+    def _output_keys(self, task_class: type, method_name: str = 'execute') -> FrozenSet[str]:
+        per_class = _OUTPUT_KEYS_CACHE.get(task_class)
+        if per_class is None:
+            per_class = _OUTPUT_KEYS_CACHE[task_class] = {}
+        keys = per_class.get(method_name)
+        if keys is None:
+            keys = frozenset(self.analyze_successful_taskresult_output_keys(task_class, method_name))
+            per_class[method_name] = keys
         return keys
 
     def _analyze_tasks(self):
-        for task in self.workflow.get_all_tasks():
+        for task in self._all_tasks:
             task_class = task.__class__
             
             if isinstance(task, StreamingTask):
                 self.streaming_tasks.add(task.name)
-                output_keys = set()
+                self._streaming_task_list.append(task)
+                output_keys = frozenset()
                 if hasattr(task_class, 'execute_streaming'):
-                    output_keys.update(self.analyze_successful_taskresult_output_keys(task_class, 'execute_streaming'))
+                    output_keys |= self._output_keys(task_class, 'execute_streaming')
                 if hasattr(task_class, 'execute'):
-                    output_keys.update(self.analyze_successful_taskresult_output_keys(task_class, 'execute'))
+                    output_keys |= self._output_keys(task_class, 'execute')
                 self.task_output_keys[task.name] = output_keys
             else:
-                output_keys = set(self.analyze_successful_taskresult_output_keys(task_class))
-                self.task_output_keys[task.name] = output_keys
+                self.task_output_keys[task.name] = self._output_keys(task_class)
                 
             self.task_dependencies[task.name] = task.task_dependencies
+            # The list keeps order for prevN lookups; the set answers membership checks
+            self._dependency_sets[task.name] = frozenset(task.task_dependencies)
 
     def _analyze_task_groups(self):
         for group_name, group in self.workflow.task_groups.items():
@@ -113,6 +185,9 @@ class WorkflowChecker:
             
             if isinstance(group, StreamingTaskGroup):
                 self.streaming_task_groups.add(group_name)
+                if group.config.for_each:
+                    referenced_task = group.config.path_parts[0]
+                    self._streaming_group_refs.setdefault(referenced_task, []).append(group_name)
 
     def _analyze_streaming_components(self):
         pass
@@ -129,8 +204,7 @@ class WorkflowChecker:
             errors.append(f"Streaming task {task.name}: Missing execute_streaming() method implementation")
         else:
             try:
-                source = inspect.getsource(task_class.execute_streaming)
-                if 'NotImplementedError' in source and 'raise NotImplementedError' in source:
+                if self._streaming_source_fact(task_class, 'not_implemented'):
                     errors.append(f"Streaming task {task.name}: execute_streaming() method raises NotImplementedError - must be implemented")
             except (TypeError, OSError):
                 errors.append(f"Streaming task {task.name}: Could not analyze execute_streaming() method")
@@ -139,6 +213,48 @@ class WorkflowChecker:
         
         return errors
 
+    @staticmethod
+    def _streaming_source_fact(task_class: type, fact: str) -> bool:
+        # Each fact is computed once per class; failures are not cached so every task reports them
+        facts = _STREAMING_SOURCE_CACHE.get(task_class)
+        if facts is None:
+            facts = _STREAMING_SOURCE_CACHE[task_class] = {}
+        value = facts.get(fact)
+        if value is not None:
+            return value
+
+        if fact == 'not_implemented':
+            source = inspect.getsource(task_class.execute_streaming)
+            value = 'NotImplementedError' in source and 'raise NotImplementedError' in source
+            facts[fact] = value
+            return value
+
+        tree = _source_tree(task_class.execute_streaming)
+        has_yield_result = False
+        has_await_yield_result = False
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                if (isinstance(node.func, ast.Attribute) and 
+                    isinstance(node.func.value, ast.Name) and 
+                    node.func.value.id == 'self' and 
+                    node.func.attr == 'yield_result'):
+                    has_yield_result = True
+                    break
+            elif isinstance(node, ast.Await):
+                if (isinstance(node.value, ast.Call) and
+                    isinstance(node.value.func, ast.Attribute) and 
+                    isinstance(node.value.func.value, ast.Name) and 
+                    node.value.func.value.id == 'self' and 
+                    node.value.func.attr == 'yield_result'):
+                    has_yield_result = True
+                    has_await_yield_result = True
+                    break
+
+        facts['yield_result'] = has_yield_result
+        facts['await_yield_result'] = has_await_yield_result
+        return facts[fact]
+
     def _check_streaming_task_yield_usage(self, task: Task) -> List[str]:
         errors = []
         
@@ -149,30 +265,8 @@ class WorkflowChecker:
         
         try:
             if hasattr(task_class, 'execute_streaming'):
-                source = inspect.getsource(task_class.execute_streaming)
-                source = textwrap.dedent(source)
-                tree = ast.parse(source)
-                
-                has_yield_result = False
-                has_await_yield_result = False
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Call):
-                        if (isinstance(node.func, ast.Attribute) and 
-                            isinstance(node.func.value, ast.Name) and 
-                            node.func.value.id == 'self' and 
-                            node.func.attr == 'yield_result'):
-                            has_yield_result = True
-                            break
-                    elif isinstance(node, ast.Await):
-                        if (isinstance(node.value, ast.Call) and
-                            isinstance(node.value.func, ast.Attribute) and 
-                            isinstance(node.value.func.value, ast.Name) and 
-                            node.value.func.value.id == 'self' and 
-                            node.value.func.attr == 'yield_result'):
-                            has_yield_result = True
-                            has_await_yield_result = True
-                            break
+                has_yield_result = self._streaming_source_fact(task_class, 'yield_result')
+                has_await_yield_result = self._streaming_source_fact(task_class, 'await_yield_result')
                 
                 if not has_yield_result:
                     errors.append(f"Streaming task {task.name}: execute_streaming() method should call yield_result() to emit intermediate results")
@@ -192,7 +286,7 @@ class WorkflowChecker:
             
         for_each_path = config.get('for_each', '')
         if for_each_path:
-            task_name = for_each_path.split('.')[0]
+            task_name = for_each_path.partition('.')[0]
             
             if task_name not in self.streaming_tasks:
                 errors.append(f"Streaming task group {group_name}: for_each path '{for_each_path}' references non-streaming task '{task_name}'. Streaming task groups should reference streaming tasks.")
@@ -209,26 +303,14 @@ class WorkflowChecker:
         errors = []
         
         for task_name in self.streaming_tasks:
-            has_streaming_dependents = False
-            
-            for group_name in self.streaming_task_groups:
-                group_config = self.task_group_configs.get(group_name, {})
-                for_each_path = group_config.get('for_each', '')
-                if for_each_path.startswith(task_name):
-                    has_streaming_dependents = True
-                    break
-            
-            if not has_streaming_dependents:
+            if task_name not in self._streaming_group_refs:
                 errors.append(f"Streaming task {task_name}: No streaming task groups depend on this task. Consider using a regular Task instead of StreamingTask if streaming is not needed.")
         
-        for group_name in self.streaming_task_groups:
-            group_config = self.task_group_configs.get(group_name, {})
-            for_each_path = group_config.get('for_each', '')
-            
-            if for_each_path:
-                referenced_task = for_each_path.split('.')[0]
-                if referenced_task not in self.streaming_tasks:
-                    errors.append(f"Streaming task group {group_name}: References non-streaming task '{referenced_task}' in for_each path. This may not work as expected.")
+        for referenced_task, group_names in self._streaming_group_refs.items():
+            if referenced_task in self.streaming_tasks:
+                continue
+            for group_name in group_names:
+                errors.append(f"Streaming task group {group_name}: References non-streaming task '{referenced_task}' in for_each path. This may not work as expected.")
         
         errors.extend(self._check_consecutive_streaming_tasks())
         
@@ -239,7 +321,11 @@ class WorkflowChecker:
         
         # Build a map of task dependencies to check for consecutive streaming tasks
         for task_name in self.streaming_tasks:
-            task_dependencies = self.task_dependencies.get(task_name, [])
+            # Most streaming tasks have no streaming dependencies at all; the set test says so
+            # without scanning the list
+            if self.streaming_tasks.isdisjoint(self._dependency_sets.get(task_name, ())):
+                continue
+            task_dependencies = self.task_dependencies[task_name]
             
             # Check if any of the direct dependencies are also streaming tasks
             for dep_name in task_dependencies:
@@ -260,70 +346,33 @@ class WorkflowChecker:
         if not output_keys:
             errors.append(f"Streaming task {task_name}: No output keys detected. Streaming tasks should return structured output.")
         
-        streaming_indicators = {'streaming_complete', 'total_found', 'progress', 'items', 'results'}
-        has_streaming_indicator = any(key in output_keys for key in streaming_indicators)
-        
-        if not has_streaming_indicator:
+        if _STREAMING_INDICATORS.isdisjoint(output_keys):
             errors.append(f"Streaming task {task_name}: Consider including streaming indicators like 'streaming_complete', 'total_found', or 'progress' in output for better streaming workflow support.")
         
         return errors
 
     def _get_similar_keys(self, task_name: str, invalid_key: str, threshold: float = 0.6) -> List[str]:
-        if task_name not in self.task_output_keys:
+        available_keys = self.task_output_keys.get(task_name)
+        if not available_keys:
             return []
         
-        available_keys = list(self.task_output_keys[task_name])
-        return get_close_matches(invalid_key, available_keys, n=3, cutoff=threshold)
-
-    def _get_suggestions(self, task_name: str, path: str) -> List[str]:
-        suggestions = []
-        parts = path.split('.')
-        
-        if not parts:
-            return suggestions
-
-        if parts[0].startswith('prev'):
-            steps_back, remaining_path = PathParser.parse_relative_path(parts[0])
-            if steps_back is None:
-                suggestions.append("Invalid 'prev' format. Use 'prev' or 'prevN' where N is a number.")
-                return suggestions
-
-            deps = self.task_dependencies[task_name]
-            if steps_back > len(deps):
-                suggestions.append(f"Only {len(deps)} previous task(s) available. Use 'prev' to 'prev{len(deps)}'.")
-                return suggestions
-
-            target_task = deps[-steps_back]
-            if remaining_path:
-                similar_keys = self._get_similar_keys(target_task, remaining_path)
-                if similar_keys:
-                    suggestions.append(f"Did you mean one of these keys from {target_task}? {', '.join(similar_keys)}")
-            return suggestions
-
-        target_task = parts[0]
-        if target_task not in self.task_dependencies[task_name]:
-            similar_tasks = get_close_matches(target_task, self.task_dependencies[task_name], n=3, cutoff=0.6)
-            if similar_tasks:
-                suggestions.append(f"Did you mean one of these tasks? {', '.join(similar_tasks)}")
-            return suggestions
-
-        if len(parts) == 1:
-            return suggestions
-
-        if target_task not in self.task_output_keys:
-            return suggestions
-
-        current_keys = self.task_output_keys[target_task]
-        current_path = parts[1]
-
-        if current_path not in current_keys:
-            similar_keys = self._get_similar_keys(target_task, current_path)
-            if similar_keys:
-                suggestions.append(f"Did you mean one of these keys from {target_task}? {', '.join(similar_keys)}")
-
-        return suggestions
+        key = (task_name, invalid_key, threshold)
+        similar = self._similar_cache.get(key)
+        if similar is None:
+            similar = self._similar_cache[key] = tuple(
+                get_close_matches(invalid_key, available_keys, n=3, cutoff=threshold)
+            )
+        return list(similar)
 
     def _validate_path(self, task_name: str, path: str) -> Tuple[bool, List[str]]:
+        key = (task_name, path)
+        cached = self._path_cache.get(key)
+        if cached is None:
+            valid, suggestions = self._check_path(task_name, path)
+            cached = self._path_cache[key] = (valid, tuple(suggestions))
+        return cached[0], list(cached[1])
+
+    def _check_path(self, task_name: str, path: str) -> Tuple[bool, List[str]]:
         if not path:
             return True, []
 
@@ -340,15 +389,19 @@ class WorkflowChecker:
             if steps_back > len(deps):
                 return False, [f"Only {len(deps)} previous task(s) available. Use 'prev' to 'prev{len(deps)}'."]
 
-            target_task = deps[-steps_back]
-            if remaining_path:
-                valid, suggestions = self._validate_path(task_name, f"{target_task}.{remaining_path}")
-                return valid, suggestions
-            return True, []
+            if not remaining_path:
+                return True, []
+            # Carry on as if the path had named the dependency directly
+            parts = [deps[-steps_back], *remaining_path.split('.')]
 
         target_task = parts[0]
-        if task_name in self.task_dependencies and target_task not in self.task_dependencies[task_name]:
-            return False, self._get_suggestions(task_name, path)
+        dependency_set = self._dependency_sets.get(task_name)
+        if dependency_set is not None and target_task not in dependency_set:
+            deps = self.task_dependencies[task_name]
+            similar_tasks = get_close_matches(target_task, deps, n=3, cutoff=0.6) if deps else None
+            if similar_tasks:
+                return False, [f"Did you mean one of these tasks? {', '.join(similar_tasks)}"]
+            return False, []
 
         if len(parts) == 1:
             return True, []
@@ -362,14 +415,28 @@ class WorkflowChecker:
         if target_task in self.task_group_configs and current_path != 'results':
             return False, [f"Task group {target_task} only has 'results' key available"]
 
-        for part in parts[1:]:
+        for depth, part in enumerate(parts[1:]):
             if part not in current_keys:
-                return False, self._get_suggestions(task_name, path)
-            current_keys = self.task_output_keys.get(f"{target_task}.{part}", set())
+                # Only a miss on the top-level key has known keys to suggest from
+                if depth == 0:
+                    similar_keys = self._get_similar_keys(target_task, part)
+                    if similar_keys:
+                        return False, [f"Did you mean one of these keys from {target_task}? {', '.join(similar_keys)}"]
+                return False, []
+            # Output analysis only records top-level keys, so nothing below them is known
+            current_keys = _NO_KEYS
 
         return True, []
 
     def _validate_task_group_path(self, group_name: str, path: str) -> Tuple[bool, List[str]]:
+        key = (group_name, path)
+        cached = self._group_path_cache.get(key)
+        if cached is None:
+            valid, suggestions = self._check_task_group_path(group_name, path)
+            cached = self._group_path_cache[key] = (valid, tuple(suggestions))
+        return cached[0], list(cached[1])
+
+    def _check_task_group_path(self, group_name: str, path: str) -> Tuple[bool, List[str]]:
         if not path:
             return True, []
 
@@ -379,7 +446,7 @@ class WorkflowChecker:
 
         target_task = parts[0]
         if target_task not in self.task_output_keys:
-            similar_tasks = get_close_matches(target_task, list(self.task_output_keys.keys()), n=3, cutoff=0.6)
+            similar_tasks = get_close_matches(target_task, self.task_output_keys, n=3, cutoff=0.6)
             if similar_tasks:
                 return False, [f"Did you mean one of these tasks? {', '.join(similar_tasks)}"]
             return False, [f"Task '{target_task}' not found"]
@@ -396,7 +463,8 @@ class WorkflowChecker:
                 if similar_keys:
                     return False, [f"Did you mean one of these keys from {target_task}? {', '.join(similar_keys)}"]
                 return False, [f"Key '{part}' not found in task '{target_task}'"]
-            current_keys = self.task_output_keys.get(f"{target_task}.{part}", set())
+            # Output analysis only records top-level keys, so nothing below them is known
+            current_keys = _NO_KEYS
 
         return True, []
 
@@ -418,9 +486,8 @@ class WorkflowChecker:
                 
             if 'operator' not in condition:
                 errors.append(f"Task {task.name}: Condition missing 'operator' field")
-            elif condition['operator'] not in {'eq', 'ne', 'gt', 'lt', 'gte', 'lte', 'in', 'not_in'}:
-                valid_ops = {'eq', 'ne', 'gt', 'lt', 'gte', 'lte', 'in', 'not_in'}
-                similar_ops = get_close_matches(condition['operator'], valid_ops, n=3, cutoff=0.6)
+            elif condition['operator'] not in _VALID_OPS:
+                similar_ops = _operator_suggestions(condition['operator'])
                 error_msg = f"Task {task.name}: Invalid operator '{condition['operator']}' in condition"
                 if similar_ops:
                     error_msg += f"\nDid you mean one of these? {', '.join(similar_ops)}"
@@ -430,7 +497,7 @@ class WorkflowChecker:
                 errors.append(f"Task {task.name}: Condition missing 'value' field")
                 
         elif isinstance(condition, str):
-            matches = re.findall(r'\${([^}]+)}', condition)
+            matches = _INTERP_RE.findall(condition) if '${' in condition else ()
             for match in matches:
                 valid, suggestions = self._validate_path(task.name, match)
                 if not valid:
@@ -447,7 +514,7 @@ class WorkflowChecker:
 
         for key, value in config.items():
             if isinstance(value, str):
-                matches = re.findall(r'\${([^}]+)}', value)
+                matches = _INTERP_RE.findall(value) if '${' in value else ()
                 for match in matches:
                     valid, suggestions = self._validate_path(task.name, match)
                     if not valid:
@@ -460,29 +527,25 @@ class WorkflowChecker:
 
         return errors
 
+    @staticmethod
+    def _get_output_paths(task_class: type) -> Tuple[Any, ...]:
+        return _scan_method(task_class.execute)[1]
+
     def _check_task_code(self, task: Task) -> List[str]:
         errors = []
-        task_class = task.__class__
         try:
-            source = inspect.getsource(task_class.execute)
-            source = textwrap.dedent(source)
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Attribute) and node.func.attr == 'get_output':
-                        if node.args:
-                            path_arg = node.args[0]
-                            if isinstance(path_arg, ast.Constant):
-                                path = path_arg.value
-                                valid, suggestions = self._validate_path(task.name, path)
-                                if not valid:
-                                    error_msg = f"Task {task.name}: Invalid path '{path}' in get_output call"
-                                    if suggestions:
-                                        error_msg += f"\nSuggestions: {'; '.join(suggestions)}"
-                                    errors.append(error_msg)
+            paths = self._get_output_paths(task.__class__)
         except (TypeError, SyntaxError, IndentationError) as e:
             errors.append(f"Task {task.name}: Failed to analyze code: {str(e)}")
+            return errors
+
+        for path in paths:
+            valid, suggestions = self._validate_path(task.name, path)
+            if not valid:
+                error_msg = f"Task {task.name}: Invalid path '{path}' in get_output call"
+                if suggestions:
+                    error_msg += f"\nSuggestions: {'; '.join(suggestions)}"
+                errors.append(error_msg)
 
         return errors
 
@@ -508,7 +571,7 @@ class WorkflowChecker:
             else:
                 for key, value in template.items():
                     if isinstance(value, str):
-                        matches = re.findall(r'\${([^}]+)}', value)
+                        matches = _INTERP_RE.findall(value) if '${' in value else ()
                         for match in matches:
                             # Skip validation for the special 'item' placeholder
                             if match == 'item':
@@ -532,8 +595,12 @@ class WorkflowChecker:
 
     def check_workflow(self) -> List[str]:
         errors = []
+
+        cyclic = self.workflow.find_dependency_cycle()
+        if cyclic:
+            errors.append(f"Circular dependency detected between: {', '.join(cyclic)}")
         
-        for task in self.workflow.get_all_tasks():
+        for task in self._all_tasks:
             errors.extend(self._check_task_config(task))
             errors.extend(self._check_task_code(task))
             
@@ -560,8 +627,7 @@ class WorkflowChecker:
     def check_streaming_workflow(self) -> List[str]:
         errors = []
         
-        for task_name in self.streaming_tasks:
-            task = self.workflow.get_task(task_name)
+        for task in self._streaming_task_list:
             errors.extend(self._check_streaming_task_implementation(task))
             errors.extend(self._validate_streaming_task_output_keys(task))
         